@@ -3,18 +3,127 @@ Accurate metric evaluator - Content freshness assessment
 """
 
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from functools import partial
+from typing import Optional, Dict, Iterable, List, Tuple
 from bs4 import BeautifulSoup
 import requests
 
+try:
+    from dateutil import parser as _dateutil_parser
+except ImportError:
+    _dateutil_parser = None
+
+# selectolax 1.0 removed the Modest engine; its Lexbor parser has the same node API
+try:
+    from selectolax.lexbor import LexborHTMLParser as _SelectolaxParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as _SelectolaxParser
+    except ImportError:
+        _SelectolaxParser = None
+
+
+# Meta tag (attribute, value) pairs that carry modification dates, in priority order
+_META_PATTERNS = (
+    ('name', 'last-modified'),
+    ('name', 'date'),
+    ('name', 'revised'),
+    ('name', 'updated'),
+    ('property', 'article:modified_time'),
+    ('property', 'article:published_time'),
+    ('name', 'article:modified_time'),
+    ('name', 'article:published_time'),
+    ('name', 'DC.Date.Modified'),
+    ('name', 'dc.date.modified'),
+    ('name', 'dcterms.modified'),
+    ('name', 'pubdate'),
+)
+
+# Schema.org date properties as (attribute, value) pairs
+_SCHEMA_PATTERNS = (
+    ('itemprop', 'dateModified'),
+    ('itemprop', 'datePublished'),
+    ('itemprop', 'dateCreated'),
+    ('itemprop', 'lastReviewed'),
+    ('property', 'dateModified'),
+    ('property', 'datePublished'),
+)
+
+# Date patterns searched for in visible page text
+_CONTENT_DATE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Updated:?\s*([A-Za-z]+ \d{1,2},?\s*\d{4})',
+    r'Last updated:?\s*([A-Za-z]+ \d{1,2},?\s*\d{4})',
+    r'Modified:?\s*([A-Za-z]+ \d{1,2},?\s*\d{4})',
+    r'Published:?\s*([A-Za-z]+ \d{1,2},?\s*\d{4})',
+    r'(\d{1,2}/\d{1,2}/\d{4})',
+    r'(\d{4}-\d{2}-\d{2})',
+    r'([A-Za-z]+ \d{1,2},? \d{4})',
+))
+
+# strptime formats tried by _parse_date_string, grouped by the shape of the
+# string so only formats that can possibly match are attempted
+_ISO_DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%dT%H:%M:%SZ',
+    '%Y-%m-%dT%H:%M:%S.%fZ',
+    '%Y-%m-%d %H:%M:%S',
+)
+_SLASH_DATE_FORMATS = (
+    '%d/%m/%Y',
+    '%m/%d/%Y',
+)
+_DAY_FIRST_DATE_FORMATS = (
+    '%d %B %Y',
+    '%d %b %Y',
+)
+_NAMED_DATE_FORMATS = (
+    '%B %d, %Y',
+    '%b %d, %Y',
+    '%a, %d %b %Y %H:%M:%S GMT',
+    '%a, %d %b %Y %H:%M:%S %Z',
+)
+
+
+def _candidate_date_formats(date_str: str) -> tuple:
+    """Pick the strptime formats that can match a date string"""
+    if not date_str[:1].isdigit():
+        return _NAMED_DATE_FORMATS
+    if date_str[4:5] == '-':
+        return _ISO_DATE_FORMATS
+    if '/' in date_str[:10]:
+        return _SLASH_DATE_FORMATS
+    return _DAY_FIRST_DATE_FORMATS
+
 
 class AccurateEvaluator:
     """Evaluate content accuracy through freshness assessment"""
     
+    # HTTP HEAD results are reused for an hour, keeping at most 500 URLs
+    HEAD_CACHE_TTL = 3600
+    HEAD_CACHE_MAX_ENTRIES = 500
+    
     def __init__(self, config):
         self.config = config
         self.freshness_thresholds = config.get_freshness_thresholds()
+        self._head_cache: Dict[str, Tuple[Optional[datetime], float]] = {}
+        self._head_cache_lock = threading.Lock()
+        
+        # Reuse connections across HEAD requests to the same host. requests does not
+        # guarantee Session thread-safety, so each evaluate_batch worker gets its own
+        self._thread_local = threading.local()
+    
+    @property
+    def _http(self) -> requests.Session:
+        """The calling thread's HTTP session, created on first use"""
+        session = getattr(self._thread_local, 'session', None)
+        if session is None:
+            session = self._thread_local.session = requests.Session()
+        return session
     
     def evaluate(self, html: str, url: str) -> str:
         """
@@ -27,8 +136,27 @@ class AccurateEvaluator:
         Returns:
             str: Accuracy rating ('High', 'Medium', 'Low')
         """
-        last_modified = self._find_last_modified_date(html, url)
+        last_modified, _ = self._find_last_modified_date(html, url)
+        return self._rate_freshness(last_modified)
+    
+    def evaluate_batch(self, items: List[Tuple[str, str]], max_workers: Optional[int] = None) -> List[str]:
+        """
+        Evaluate content accuracy for many pages concurrently
         
+        Args:
+            items: (html, url) pairs to evaluate
+            max_workers: Maximum number of worker threads (defaults to the executor's choice)
+            
+        Returns:
+            List[str]: Accuracy ratings in the same order as items
+        """
+        # Worker threads overlap the blocking HEAD requests with parsing of other pages
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.evaluate, html, url) for html, url in items]
+            return [future.result() for future in futures]
+    
+    def _rate_freshness(self, last_modified: Optional[datetime]) -> str:
+        """Convert a last modified date to an accuracy rating"""
         if not last_modified:
             return "Low"  # No date found
         
@@ -43,62 +171,56 @@ class AccurateEvaluator:
         else:
             return "Low"
     
-    def _find_last_modified_date(self, html: str, url: str) -> Optional[datetime]:
-        """Find the last modified date from multiple sources"""
-        # Try different methods in order of reliability
+    def _find_last_modified_date(self, html: str, url: str, collect_all: bool = False) -> Tuple[Optional[datetime], List[str]]:
+        """
+        Find the last modified date from multiple sources
         
-        # 1. Check meta tags
-        date = self._check_meta_tags(html)
-        if date:
-            return date
+        Args:
+            html: HTML content to analyze
+            url: URL of the content
+            collect_all: Check every page source instead of stopping at the first date found
+            
+        Returns:
+            Tuple of the date from the most reliable source and the names of the page sources where a date was found
+        """
+        # When only the rating matters, any date inside the 'high' threshold settles it,
+        # so the multi-candidate scans can stop at the first such date
+        stop_at = None
+        if not collect_all:
+            stop_at = datetime.now() - timedelta(days=self.freshness_thresholds['high'])
         
-        # 2. Check schema.org markup
-        date = self._check_schema_org(html)
-        if date:
-            return date
+        # Try different methods in order of reliability
+        page_checks = (
+            ('meta_tags', self._check_meta_tags),
+            ('schema_org', self._check_schema_org),
+            ('time_elements', partial(self._check_time_elements, stop_at=stop_at)),
+            ('content_patterns', partial(self._check_content_dates, stop_at=stop_at)),
+        )
         
-        # 3. Check time elements
-        date = self._check_time_elements(html)
-        if date:
-            return date
+        last_modified = None
+        sources = []
         
-        # 4. Check for date patterns in content
-        date = self._check_content_dates(html)
-        if date:
-            return date
+        for source, check in page_checks:
+            date = check(html)
+            if date:
+                sources.append(source)
+                if last_modified is None:
+                    last_modified = date
+                if not collect_all:
+                    break
         
-        # 5. Check HTTP headers (if possible)
-        date = self._check_http_headers(url)
-        if date:
-            return date
+        # Check HTTP headers (if possible) only when the page itself has no date
+        if last_modified is None:
+            last_modified = self._check_http_headers(url)
         
-        return None
+        return last_modified, sources
     
     def _check_meta_tags(self, html: str) -> Optional[datetime]:
         """Check meta tags for last modified date"""
         try:
-            soup = BeautifulSoup(html, 'lxml')
-            
-            # Common meta tag patterns
-            meta_patterns = [
-                {'name': 'last-modified'},
-                {'name': 'date'},
-                {'name': 'revised'},
-                {'name': 'updated'},
-                {'property': 'article:modified_time'},
-                {'property': 'article:published_time'},
-                {'name': 'article:modified_time'},
-                {'name': 'article:published_time'},
-                {'name': 'DC.Date.Modified'},
-                {'name': 'dc.date.modified'},
-                {'name': 'dcterms.modified'},
-                {'name': 'pubdate'}
-            ]
-            
-            for pattern in meta_patterns:
-                meta_tag = soup.find('meta', attrs=pattern)
-                if meta_tag and meta_tag.get('content'):
-                    date = self._parse_date_string(meta_tag['content'])
+            for content in self._iter_meta_contents(html):
+                if content:
+                    date = self._parse_date_string(content)
                     if date:
                         return date
             
@@ -107,23 +229,30 @@ class AccurateEvaluator:
         except Exception:
             return None
     
+    def _iter_meta_contents(self, html: str):
+        """Yield the content of the first meta tag matching each pattern, in priority order"""
+        if _SelectolaxParser:
+            # Native selectolax parsing avoids building a BeautifulSoup tree
+            tree = _SelectolaxParser(html)
+            for attr, value in _META_PATTERNS:
+                node = tree.css_first(f'meta[{attr}="{value}"]')
+                if node:
+                    yield node.attributes.get('content')
+            return
+        
+        soup = BeautifulSoup(html, 'lxml')
+        for attr, value in _META_PATTERNS:
+            meta_tag = soup.find('meta', attrs={attr: value})
+            if meta_tag:
+                yield meta_tag.get('content')
+    
     def _check_schema_org(self, html: str) -> Optional[datetime]:
         """Check schema.org markup for dates"""
         try:
             soup = BeautifulSoup(html, 'lxml')
             
-            # Look for schema.org date properties
-            schema_patterns = [
-                {'itemprop': 'dateModified'},
-                {'itemprop': 'datePublished'},
-                {'itemprop': 'dateCreated'},
-                {'itemprop': 'lastReviewed'},
-                {'property': 'dateModified'},
-                {'property': 'datePublished'}
-            ]
-            
-            for pattern in schema_patterns:
-                elements = soup.find_all(attrs=pattern)
+            for attr, value in _SCHEMA_PATTERNS:
+                elements = soup.find_all(attrs={attr: value})
                 for element in elements:
                     # Check content attribute first
                     if element.get('content'):
@@ -148,85 +277,85 @@ class AccurateEvaluator:
         except Exception:
             return None
     
-    def _check_time_elements(self, html: str) -> Optional[datetime]:
+    def _check_time_elements(self, html: str, stop_at: Optional[datetime] = None) -> Optional[datetime]:
         """Check HTML time elements"""
         try:
-            soup = BeautifulSoup(html, 'lxml')
-            
-            # Find all time elements
-            time_elements = soup.find_all('time')
-            
-            latest_date = None
-            
-            for time_elem in time_elements:
-                # Check datetime attribute
-                if time_elem.get('datetime'):
-                    date = self._parse_date_string(time_elem['datetime'])
-                    if date and (not latest_date or date > latest_date):
-                        latest_date = date
-                
-                # Check element text
-                text = time_elem.get_text(strip=True)
-                if text:
-                    date = self._parse_date_string(text)
-                    if date and (not latest_date or date > latest_date):
-                        latest_date = date
-            
-            return latest_date
+            return self._latest_date(self._iter_time_candidates(html), stop_at)
             
         except Exception:
             return None
     
-    def _check_content_dates(self, html: str) -> Optional[datetime]:
+    def _iter_time_candidates(self, html: str):
+        """Yield the datetime attribute and text of every time element, in document order"""
+        # A real parser is needed: <time> markup inside comments and scripts is not an element
+        if _SelectolaxParser:
+            for node in _SelectolaxParser(html).css('time'):
+                yield node.attributes.get('datetime')
+                yield node.text(deep=True, strip=True)
+            return
+        
+        soup = BeautifulSoup(html, 'lxml')
+        for time_elem in soup.find_all('time'):
+            yield time_elem.get('datetime')
+            yield time_elem.get_text(strip=True)
+    
+    def _check_content_dates(self, html: str, stop_at: Optional[datetime] = None) -> Optional[datetime]:
         """Check for date patterns in content"""
         try:
             soup = BeautifulSoup(html, 'lxml')
             text = soup.get_text()
             
-            # Look for common date patterns
-            date_patterns = [
-                r'Updated:?\s*([A-Za-z]+ \d{1,2},?\s*\d{4})',
-                r'Last updated:?\s*([A-Za-z]+ \d{1,2},?\s*\d{4})',
-                r'Modified:?\s*([A-Za-z]+ \d{1,2},?\s*\d{4})',
-                r'Published:?\s*([A-Za-z]+ \d{1,2},?\s*\d{4})',
-                r'(\d{1,2}/\d{1,2}/\d{4})',
-                r'(\d{4}-\d{2}-\d{2})',
-                r'([A-Za-z]+ \d{1,2},? \d{4})'
-            ]
-            
-            latest_date = None
-            
-            for pattern in date_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    date = self._parse_date_string(match)
-                    if date and (not latest_date or date > latest_date):
-                        latest_date = date
+            candidates = (
+                match.group(1)
+                for pattern in _CONTENT_DATE_PATTERNS
+                for match in pattern.finditer(text)
+            )
             
-            return latest_date
+            return self._latest_date(candidates, stop_at)
             
         except Exception:
             return None
     
     def _check_http_headers(self, url: str) -> Optional[datetime]:
         """Check HTTP headers for last modified date"""
+        cached = self._head_cache.get(url)
+        if cached and time.monotonic() < cached[1]:
+            return cached[0]
+        
         try:
-            response = requests.head(url, timeout=10)
-            
-            # Check Last-Modified header
-            last_modified = response.headers.get('Last-Modified')
-            if last_modified:
-                return self._parse_date_string(last_modified)
-            
-            # Check Date header as fallback
-            date_header = response.headers.get('Date')
-            if date_header:
-                return self._parse_date_string(date_header)
-            
-            return None
-            
+            response = self._http.head(url, timeout=10, allow_redirects=True)
         except Exception:
             return None
+        
+        # Check Last-Modified header, then Date header as fallback
+        header_value = response.headers.get('Last-Modified') or response.headers.get('Date')
+        date = self._parse_date_string(header_value) if header_value else None
+        
+        self._cache_head_result(url, date)
+        return date
+    
+    def _cache_head_result(self, url: str, date: Optional[datetime]):
+        """Store a HEAD lookup result, evicting the oldest entry when full"""
+        with self._head_cache_lock:
+            self._head_cache.pop(url, None)
+            if len(self._head_cache) >= self.HEAD_CACHE_MAX_ENTRIES:
+                # Dicts preserve insertion order, so the first key is the oldest
+                del self._head_cache[next(iter(self._head_cache))]
+            self._head_cache[url] = (date, time.monotonic() + self.HEAD_CACHE_TTL)
+    
+    def _latest_date(self, candidates: Iterable[str], stop_at: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        Return the most recent parseable date among candidate strings
+        
+        If stop_at is given, the first date at or after it is returned without
+        parsing the remaining candidates.
+        """
+        dates = []
+        for date in filter(None, map(self._parse_date_string, candidates)):
+            if stop_at and date >= stop_at:
+                return date
+            dates.append(date)
+        return max(dates, default=None)
     
     def _parse_date_string(self, date_str: str) -> Optional[datetime]:
         """Parse various date string formats"""
@@ -235,42 +364,25 @@ class AccurateEvaluator:
         
         date_str = date_str.strip()
         
-        # Common date formats to try
-        formats = [
-            '%Y-%m-%d',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%dT%H:%M:%S.%fZ',
-            '%Y-%m-%d %H:%M:%S',
-            '%d/%m/%Y',
-            '%m/%d/%Y',
-            '%B %d, %Y',
-            '%b %d, %Y',
-            '%d %B %Y',
-            '%d %b %Y',
-            '%a, %d %b %Y %H:%M:%S GMT',
-            '%a, %d %b %Y %H:%M:%S %Z'
-        ]
-        
-        for fmt in formats:
+        for fmt in _candidate_date_formats(date_str):
             try:
                 return datetime.strptime(date_str, fmt)
             except ValueError:
                 continue
         
         # Try parsing with dateutil if available
-        try:
-            from dateutil import parser
-            return parser.parse(date_str)
-        except (ImportError, ValueError):
-            pass
+        if _dateutil_parser:
+            try:
+                return _dateutil_parser.parse(date_str)
+            except (ValueError, OverflowError):
+                pass
         
         return None
     
     def get_detailed_analysis(self, html: str, url: str) -> Dict:
         """Get detailed freshness analysis"""
-        last_modified = self._find_last_modified_date(html, url)
-        rating = self.evaluate(html, url)
+        last_modified, sources = self._find_last_modified_date(html, url, collect_all=True)
+        rating = self._rate_freshness(last_modified)
         
         analysis = {
             'rating': rating,
@@ -283,18 +395,6 @@ class AccurateEvaluator:
         if last_modified:
             age_days = (datetime.now() - last_modified).days
             analysis['age_days'] = age_days
-            
-            # Check which sources we found dates in
-            sources = []
-            if self._check_meta_tags(html):
-                sources.append('meta_tags')
-            if self._check_schema_org(html):
-                sources.append('schema_org')
-            if self._check_time_elements(html):
-                sources.append('time_elements')
-            if self._check_content_dates(html):
-                sources.append('content_patterns')
-            
             analysis['sources_found'] = sources
             
             # Generate recommendations
@@ -4,28 +4,183 @@ Polished metric evaluator - Grammar and language quality assessment
 
 import re
 import asyncio
-from typing import Dict, List, Optional
+import copy
+import hashlib
+import logging
+import string
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 import openai
+import orjson
 import os
 
+try:
+    import httpx as _httpx
+except ImportError:
+    _httpx = None
+
+try:
+    import h2 as _h2  # enables HTTP/2 in httpx
+except ImportError:
+    _h2 = None
+
+
+logger = logging.getLogger(__name__)
+
+# Common misspellings, matched against lowercased tokens stripped of punctuation
+_MISSPELLINGS = frozenset({
+    'teh',          # the
+    'recieve',      # receive
+    'occured',      # occurred
+    'accomodate',   # accommodate
+    'definate',     # definite
+    'seperate',     # separate
+    'experiance',   # experience
+    'enviroment',   # environment
+})
+
+# Punctuation issue patterns (case-sensitive)
+_PUNCT_PATTERNS = (
+    r'  +',               # Multiple spaces
+    r'[.!?][A-Za-z]',     # Missing spaces after punctuation
+    r"its'",              # Incorrect apostrophe usage (it's vs its)
+    r'[.!?]{2,}',         # Multiple punctuation
+    r' [.!?:;,]',         # Space before punctuation
+)
+
+# Common grammar mistakes as lowercase word pairs, matched against adjacent tokens
+# in one pass (like a many-literal automaton, without the regex alternation)
+_GRAMMAR_BIGRAMS = frozenset({
+    ('your', 'welcome'),     # you're welcome
+    ('its', 'going'),        # it's going
+    ('would', 'of'),         # would have
+    ('could', 'of'),         # could have
+    ('should', 'of'),        # should have
+    ('there', 'going'),      # they're going
+    ('to', 'much'),          # too much
+})
+_GRAMMAR_WORDS = frozenset({
+    'alot',                  # a lot
+})
+
+# Word runs inside a token, with the same ASCII \w boundaries the regexes use, so
+# "much-fun" or "alot's" still yield "much" and "alot"
+_WORD_RUN_RE = re.compile(r'\w+', re.ASCII)
+_TRAILING_WORD_RE = re.compile(r'\w+$', re.ASCII)
+
+# Regex equivalents, only used to screen content in the clean fast path
+_GRAMMAR_PATTERNS = tuple(
+    r'\b' + r'\s+'.join(words) + r'\b' for words in sorted(_GRAMMAR_BIGRAMS)
+) + tuple(r'\b' + word + r'\b' for word in sorted(_GRAMMAR_WORDS))
+
+# Excessive use of passive voice (basic check); the auxiliaries never end in
+# "ed", so one alternation counts exactly what separate patterns would
+_PASSIVE_PATTERN = r'\b(?:was|were|is|are)\s+\w+ed\b'
+
+# The word patterns are plain English, so re.ASCII lets the engine skip Unicode
+# case folding. Extracted text has its whitespace normalized to ASCII spaces.
+_WORD_FLAGS = re.IGNORECASE | re.ASCII
+
+_PUNCT_RES = tuple(re.compile(pattern) for pattern in _PUNCT_PATTERNS)
+_PASSIVE_RE = re.compile(_PASSIVE_PATTERN, _WORD_FLAGS)
+
+# Any indicator a rule-based check could flag: punctuation, grammar and passive
+# patterns plus a lowercase sentence start. No match means those checks find nothing.
+_SUSPECT = re.compile(
+    '|'.join(_PUNCT_PATTERNS)
+    + '|(?ai:' + '|'.join(_GRAMMAR_PATTERNS + (_PASSIVE_PATTERN,)) + ')'
+    + r'|(?:^|[.!?])["\'\s]*[a-z]'
+)
+
+# Issue reported for each rule-based category with a non-zero count
+_RULE_ISSUE_MESSAGES = (
+    ('spelling', "Potential spelling errors detected"),
+    ('punctuation', "Punctuation issues found"),
+    ('capitalization', "Capitalization errors detected"),
+    ('grammar', "Common grammar mistakes found"),
+    ('style', "Style and readability issues detected"),
+)
+
+_SENT_RE = re.compile(r'[^.!?]+')
+_TOKEN_RE = re.compile(r'\S+')
+_SENTENCE_START_RE = re.compile(r'^["\'\s]*([a-zA-Z])')
+
 
 class PolishedEvaluator:
     """Evaluate grammar and language quality"""
     
+    # Below this many documents the Batch API's turnaround isn't worth it
+    BATCH_API_MIN_DOCUMENTS = 100
+    BATCH_POLL_INTERVAL = 30
+    RESULT_CACHE_MAX_ENTRIES = 1024
+    FAST_PATH_MAX_WORDS = 200
+    THREAD_OFFLOAD_MIN_CHARS = 50_000
+    
+    # One client per API key and retry policy for the whole process so concurrent
+    # chunk requests share a connection pool (multiplexed over HTTP/2 when h2 is installed)
+    _shared_clients: Dict[Tuple, openai.AsyncOpenAI] = {}
+    # Live evaluators per shared client; the client is closed when the last one is closed
+    _client_refs: Dict[Tuple, int] = {}
+    
     def __init__(self, config):
         self.config = config
         self.polished_config = config.get_polished_config()
         
+        # Cap in-flight OpenAI requests so concurrent chunks don't trigger rate limits
+        self._semaphore = asyncio.Semaphore(self.polished_config.get('max_concurrency', 8))
+        
+        # LRU caches of ratings and detailed analyses keyed by content hash
+        self._rating_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._analysis_cache: "OrderedDict[bytes, Dict]" = OrderedDict()
+        
         # Initialize OpenAI client if API key is available
         self.use_llm = self.polished_config.get('use_llm', True)
+        self._client_key = None
         if self.use_llm:
             try:
                 api_key = config.get_openai_api_key()
-                self.openai_client = openai.OpenAI(api_key=api_key)
+                api_config = config.get_api_config()
+                
+                client_key = (api_key, api_config.get('max_retries', 3), api_config.get('timeout_seconds', 30))
+                if client_key not in PolishedEvaluator._shared_clients:
+                    PolishedEvaluator._shared_clients[client_key] = openai.AsyncOpenAI(
+                        api_key=api_key,
+                        max_retries=client_key[1],
+                        timeout=client_key[2],
+                        http_client=self._build_http_client(client_key[2])
+                    )
+                self.openai_client = PolishedEvaluator._shared_clients[client_key]
+                PolishedEvaluator._client_refs[client_key] = PolishedEvaluator._client_refs.get(client_key, 0) + 1
+                self._client_key = client_key
             except:
                 self.use_llm = False
                 self.openai_client = None
     
+    def _build_http_client(self, timeout: float):
+        """Build a pooled httpx client, or None to let the SDK use its default"""
+        if _httpx is None:
+            return None
+        
+        return _httpx.AsyncClient(
+            http2=_h2 is not None,
+            limits=_httpx.Limits(max_keepalive_connections=100, max_connections=200),
+            timeout=timeout
+        )
+    
+    async def aclose(self):
+        """Release the shared OpenAI client, closing it and its connection pool once no evaluator uses it"""
+        client_key = self._client_key
+        if client_key is None:
+            return
+        
+        self._client_key = None
+        self.openai_client = None
+        
+        PolishedEvaluator._client_refs[client_key] -= 1
+        if PolishedEvaluator._client_refs[client_key] == 0:
+            del PolishedEvaluator._client_refs[client_key]
+            await PolishedEvaluator._shared_clients.pop(client_key).close()
+    
     async def evaluate(self, content: str) -> str:
         """
         Evaluate content grammar and language quality
@@ -39,113 +194,331 @@ class PolishedEvaluator:
         if not content or not content.strip():
             return "Very Poor"
         
+        cache_key = self._content_key(content)
+        cached = self._cache_get(self._rating_cache, cache_key)
+        if cached is not None:
+            return cached
+        
+        # Tokenize once and share the word list with every check
+        words = content.split()
+        
+        # Short content with nothing for the rules to flag skips the LLM round trip
+        if self._is_obviously_clean(content, words):
+            return "Excellent"
+        
         try:
             if self.use_llm and self.openai_client:
                 # Use LLM for comprehensive grammar checking
-                error_rate = await self._llm_grammar_check(content)
+                error_rate, complete = await self._llm_grammar_check(content, words)
             else:
                 # Use rule-based grammar checking
-                error_rate = self._rule_based_grammar_check(content)
+                error_rate = await self._run_rules(self._rule_based_grammar_check, content, words)
+                complete = True
             
             # Convert error rate to rating
-            return self._error_rate_to_rating(error_rate)
+            rating = self._error_rate_to_rating(error_rate)
+            
+            # Ratings degraded by an LLM fallback are not cached, so the next call retries the API
+            if complete:
+                self._cache_put(self._rating_cache, cache_key, rating)
+            return rating
             
         except Exception:
             # Fallback to basic checks
-            error_rate = self._basic_grammar_check(content)
+            error_rate = self._basic_grammar_check(content, words)
             return self._error_rate_to_rating(error_rate)
     
-    async def _llm_grammar_check(self, content: str) -> float:
-        """Use LLM to check grammar and language quality"""
+    async def _llm_grammar_check(self, content: str, words: Optional[List[str]] = None) -> Tuple[float, bool]:
+        """Use LLM to check grammar and language quality, returning the error rate and whether every chunk was scored by the LLM"""
+        error_rate, _, complete = await self._llm_full_analysis(content, words, with_issues=False)
+        return error_rate, complete
+    
+    async def _llm_full_analysis(self, content: str, words: Optional[List[str]] = None,
+                                 with_issues: bool = True) -> Tuple[float, List[str], bool]:
+        """
+        Score every chunk with one LLM call each, optionally collecting the issues it lists
+        
+        Args:
+            content: Text content to analyze
+            words: Pre-split words of the content, if already available
+            with_issues: Also ask for a short list of issues found in each chunk
+        
+        Returns:
+            Tuple of (error rate, up to 10 issues, whether every chunk was scored by the LLM)
+        """
+        if words is None:
+            words = content.split()
+        
         try:
             # Split content into chunks if too long
             chunks = self._split_content(content, max_words=800)
+            
+            # Check all chunks concurrently
+            results = await asyncio.gather(
+                *[self._score_chunk(chunk, with_issues) for chunk in chunks],
+                return_exceptions=True
+            )
+            
             total_errors = 0
             total_words = 0
-            
-            for chunk in chunks:
-                word_count = len(chunk.split())
-                if word_count == 0:
-                    continue
+            issues = []
+            complete = True
+            for chunk, result in zip(chunks, results):
+                if isinstance(result, Exception):
+                    # Fallback for this chunk
+                    chunk_word_list = chunk.split()
+                    word_count = len(chunk_word_list)
+                    result = (self._basic_grammar_check(chunk, chunk_word_list) * word_count, word_count, [], True)
                 
-                # Create prompt for grammar checking
-                prompt = f"""Please analyze the following text for grammar, spelling, punctuation, and style issues. 
+                chunk_errors, chunk_words, chunk_issues, fell_back = result
+                total_errors += chunk_errors
+                total_words += chunk_words
+                issues.extend(chunk_issues)
+                if fell_back:
+                    complete = False
+            
+            issues = list(dict.fromkeys(issues))[:10]  # Limit to top 10 issues
+            
+            if total_words == 0:
+                return 0.5, issues, complete  # Default moderate error rate
+            
+            return total_errors / total_words, issues, complete
+        
+        except Exception:
+            # Fallback to rule-based checking
+            return self._rule_based_grammar_check(content, words), [], False
+    
+    async def _score_chunk(self, chunk: str, with_issues: bool = False) -> Tuple[float, int, List[str], bool]:
+        """
+        Ask the LLM for the error count (and optionally issues) of a single chunk; words are counted locally
+        
+        Returns:
+            Tuple of (error count, word count, issues, whether the rule-based fallback was used)
+        """
+        chunk_words = chunk.split()
+        word_count = len(chunk_words)
+        
+        try:
+            async with self._semaphore:
+                response = await self.openai_client.chat.completions.create(
+                    **self._chunk_request(chunk, with_issues)
+                )
+            
+            result = orjson.loads(response.choices[0].message.content)
+            issues = [str(issue).strip() for issue in result.get('issues', []) if str(issue).strip()]
+            
+            return result.get('error_count', 0), word_count, issues, False
+            
+        except Exception:
+            # Fallback for this chunk
+            fallback_rate = self._basic_grammar_check(chunk, chunk_words)
+            return fallback_rate * word_count, word_count, [], True
+    
+    def _chunk_request(self, chunk: str, with_issues: bool = False) -> Dict:
+        """Build the chat completion request for grammar checking a chunk"""
+        issues_field = '\n    "issues": ["specific, concise issue", ...],' if with_issues else ''
+        
+        # Create prompt for grammar checking
+        prompt = f"""Please analyze the following text for grammar, spelling, punctuation, and style issues. 
                 
 Return only a JSON object with this exact format:
 {{
-    "error_count": <number>,
-    "word_count": <number>,
-    "error_types": ["type1", "type2", ...],
+    "error_count": <number>,{issues_field}
     "severity": "low|medium|high"
 }}
 
 Text to analyze:
 {chunk}"""
-                
-                try:
-                    response = await asyncio.to_thread(
-                        self.openai_client.chat.completions.create,
-                        model="gpt-3.5-turbo",
-                        messages=[
-                            {"role": "system", "content": "You are a professional editor analyzing text quality. Respond only with valid JSON."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        max_tokens=200,
-                        temperature=0.1
-                    )
-                    
-                    import json
-                    result = json.loads(response.choices[0].message.content)
-                    
-                    chunk_errors = result.get('error_count', 0)
-                    chunk_words = result.get('word_count', word_count)
-                    
-                    total_errors += chunk_errors
-                    total_words += chunk_words
-                    
-                except Exception:
-                    # Fallback for this chunk
-                    fallback_rate = self._basic_grammar_check(chunk)
-                    total_errors += fallback_rate * word_count
-                    total_words += word_count
-            
-            if total_words == 0:
-                return 0.5  # Default moderate error rate
+        
+        return {
+            "model": "gpt-3.5-turbo",
+            "messages": [
+                {"role": "system", "content": "You are a professional editor analyzing text quality. Respond only with valid JSON."},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": 300 if with_issues else 60,
+            "temperature": 0.1,
+            "response_format": {"type": "json_object"}
+        }
+    
+    async def evaluate_batch(self, contents: List[str]) -> List[str]:
+        """
+        Evaluate many documents, using the OpenAI Batch API for large jobs
+        
+        Args:
+            contents: Text contents to evaluate
             
-            return total_errors / total_words
+        Returns:
+            List[str]: Quality ratings in the same order as contents
+        """
+        ratings: List[Optional[str]] = [None] * len(contents)
+        pending = []
+        for index, content in enumerate(contents):
+            # The same shortcuts as evaluate(), so a document gets the same rating either way
+            if not content or not content.strip():
+                ratings[index] = "Very Poor"
+                continue
+            cached = self._cache_get(self._rating_cache, self._content_key(content))
+            if cached is not None:
+                ratings[index] = cached
+            elif self._is_obviously_clean(content, content.split()):
+                ratings[index] = "Excellent"
+            else:
+                pending.append(index)
+        
+        pending_contents = [contents[index] for index in pending]
+        if self.use_llm and self.openai_client and len(pending) >= self.BATCH_API_MIN_DOCUMENTS:
+            try:
+                pending_ratings = await self._evaluate_with_batch_api(pending_contents)
+            except Exception:
+                logger.exception("Batch API job for %d documents failed; evaluating them one by one", len(pending))
+                pending_ratings = await asyncio.gather(*[self.evaluate(content) for content in pending_contents])
+        else:
+            pending_ratings = await asyncio.gather(*[self.evaluate(content) for content in pending_contents])
+        
+        for index, rating in zip(pending, pending_ratings):
+            ratings[index] = rating
+        return ratings
+    
+    async def _evaluate_with_batch_api(self, contents: List[str]) -> List[str]:
+        """Submit every chunk of every document as one Batch API job and reduce the results"""
+        chunks_by_id = {}
+        lines = []
+        for doc_index, content in enumerate(contents):
+            if not content or not content.strip():
+                continue
+            for chunk_index, chunk in enumerate(self._split_content(content, max_words=800)):
+                custom_id = f"{doc_index}-{chunk_index}"
+                chunks_by_id[custom_id] = (doc_index, chunk)
+                lines.append(orjson.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._chunk_request(chunk)
+                }))
+        
+        batch_file = await self.openai_client.files.create(
+            file=("polished_batch.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = await self.openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        
+        while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+            await asyncio.sleep(self.BATCH_POLL_INTERVAL)
+            batch = await self.openai_client.batches.retrieve(batch.id)
+        
+        if batch.status != 'completed' or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch.id} finished with status {batch.status}")
+        
+        output = await self.openai_client.files.content(batch.output_file_id)
+        
+        # Chunk results keyed by custom_id; anything missing falls back to the basic check
+        chunk_results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line)
+                doc_index, chunk = chunks_by_id[record['custom_id']]
+                result = orjson.loads(record['response']['body']['choices'][0]['message']['content'])
+                chunk_results[record['custom_id']] = (
+                    result.get('error_count', 0),
+                    len(chunk.split())
+                )
+            except Exception:
+                continue
+        
+        # Per document: [error total, word total, every chunk scored by the LLM]
+        totals = [[0, 0, True] for _ in contents]
+        for custom_id, (doc_index, chunk) in chunks_by_id.items():
+            if custom_id in chunk_results:
+                chunk_errors, chunk_words = chunk_results[custom_id]
+            else:
+                chunk_words = len(chunk.split())
+                chunk_errors = self._basic_grammar_check(chunk) * chunk_words
+                totals[doc_index][2] = False
+            totals[doc_index][0] += chunk_errors
+            totals[doc_index][1] += chunk_words
+        
+        ratings = []
+        for content, (total_errors, total_words, complete) in zip(contents, totals):
+            if not content or not content.strip():
+                ratings.append("Very Poor")
+                continue
             
-        except Exception:
-            # Fallback to rule-based checking
-            return self._rule_based_grammar_check(content)
+            error_rate = total_errors / total_words if total_words else 0.5
+            rating = self._error_rate_to_rating(error_rate)
+            # As in evaluate(), ratings degraded by a fallback are not cached
+            if complete:
+                self._cache_put(self._rating_cache, self._content_key(content), rating)
+            ratings.append(rating)
+        
+        return ratings
+    
+    async def _run_rules(self, check, content: str, *args):
+        """Run a CPU-bound rule check, in a worker thread for large content so the event loop stays free"""
+        if len(content) > self.THREAD_OFFLOAD_MIN_CHARS:
+            return await asyncio.to_thread(check, content, *args)
+        return check(content, *args)
     
-    def _rule_based_grammar_check(self, content: str) -> float:
+    def _rule_based_grammar_check(self, content: str, words: Optional[List[str]] = None,
+                                  counts: Optional[Dict[str, int]] = None) -> float:
         """Rule-based grammar and style checking"""
         if not content:
             return 0.5
         
-        words = content.split()
+        if words is None:
+            words = content.split()
         word_count = len(words)
         
         if word_count == 0:
             return 0.5
         
-        error_count = 0
+        if counts is None:
+            counts = self._rule_based_counts(content, words)
         
-        # Check for common grammar issues
-        error_count += self._check_spelling_patterns(content)
-        error_count += self._check_punctuation_issues(content)
-        error_count += self._check_capitalization_issues(content)
-        error_count += self._check_common_grammar_mistakes(content)
-        error_count += self._check_style_issues(content)
+        return sum(counts.values()) / word_count
+    
+    def _rule_based_counts(self, content: str, words: Optional[List[str]] = None) -> Dict[str, int]:
+        """Count rule-based issues per category so scoring and the issues list share one scan"""
+        if words is None:
+            words = content.split()
+        
+        # Spelling and grammar work on tokens, passive voice is one regex scan,
+        # capitalization and sentence length need sentence segmentation
+        lowered = [word.lower() for word in words]
+        capitalization_issues, long_sentences = self._check_sentences(content)
+        
+        return {
+            'spelling': self._count_misspellings(lowered) + self._count_repeated_words(lowered),
+            'punctuation': self._check_punctuation_issues(content),
+            'capitalization': capitalization_issues,
+            'grammar': self._count_grammar_mistakes(lowered),
+            'style': int(long_sentences + len(_PASSIVE_RE.findall(content)) * 0.5)
+        }
+    
+    def _is_obviously_clean(self, content: str, words: List[str]) -> bool:
+        """Check whether short content has no issue indicators at all"""
+        if len(words) >= self.FAST_PATH_MAX_WORDS or _SUSPECT.search(content):
+            return False
         
-        return error_count / word_count
+        lowered = [word.lower() for word in words]
+        if self._count_misspellings(lowered) or self._count_repeated_words(lowered):
+            return False
+        
+        return len(words) <= 40 or self._count_long_sentences(content) == 0
     
-    def _basic_grammar_check(self, content: str) -> float:
+    def _basic_grammar_check(self, content: str, words: Optional[List[str]] = None) -> float:
         """Basic grammar checking for fallback"""
         if not content:
             return 0.5
         
-        words = content.split()
+        if words is None:
+            words = content.split()
         word_count = len(words)
         
         if word_count == 0:
@@ -154,126 +527,122 @@ Text to analyze:
         error_count = 0
         
         # Very basic checks
-        error_count += self._check_spelling_patterns(content) * 0.5
+        error_count += self._check_spelling_patterns(content, words) * 0.5
         error_count += self._check_punctuation_issues(content) * 0.5
         
         return min(0.2, error_count / word_count)  # Cap at 20% error rate for basic check
     
-    def _check_spelling_patterns(self, content: str) -> int:
+    def _check_spelling_patterns(self, content: str, words: Optional[List[str]] = None) -> int:
         """Check for common spelling patterns that indicate errors"""
-        error_count = 0
-        
-        # Common misspellings patterns
-        misspelling_patterns = [
-            r'\bteh\b',           # the
-            r'\brecieve\b',       # receive
-            r'\boccur\b',         # occur (checking for occured instead of occurred)
-            r'\baccommodate\b',   # accommodate
-            r'\bdefinate\b',      # definite
-            r'\bseperate\b',      # separate
-            r'\bexperiance\b',    # experience
-            r'\benvironment\b',   # environment
-            r'\bpublic\b.*\bpublic\b',  # duplicate words
-        ]
-        
-        for pattern in misspelling_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            error_count += len(matches)
+        lowered = [word.lower() for word in (content.split() if words is None else words)]
+        return self._count_misspellings(lowered) + self._count_repeated_words(lowered)
+    
+    def _count_misspellings(self, lowered: List[str]) -> int:
+        """Count tokens found in the common-misspellings set"""
+        return sum(1 for word in lowered if word.strip(string.punctuation) in _MISSPELLINGS)
+    
+    def _count_grammar_mistakes(self, lowered: List[str]) -> int:
+        """Count common grammar mistakes among single tokens and adjacent token pairs
         
-        # Check for repeated words
-        words = content.split()
-        for i in range(len(words) - 1):
-            if words[i].lower() == words[i + 1].lower() and len(words[i]) > 2:
-                error_count += 1
+        Counts equal the word-boundary regexes in _GRAMMAR_PATTERNS: a pair matches
+        when the first token ends with its first word and the next token starts with
+        its second word, and single words match any word run inside a token.
+        """
+        error_count = 0
+        for word in lowered:
+            if word.isascii() and word.isalnum():
+                error_count += word in _GRAMMAR_WORDS
+            else:
+                error_count += sum(1 for run in _WORD_RUN_RE.findall(word) if run in _GRAMMAR_WORDS)
         
+        for current, following in zip(lowered, lowered[1:]):
+            if not (current.isascii() and current.isalnum()):
+                match = _TRAILING_WORD_RE.search(current)
+                if match is None:
+                    continue
+                current = match.group()
+            if not (following.isascii() and following.isalnum()):
+                match = _WORD_RUN_RE.match(following)
+                if match is None:
+                    continue
+                following = match.group()
+            error_count += (current, following) in _GRAMMAR_BIGRAMS
         return error_count
     
+    def _count_repeated_words(self, lowered: List[str]) -> int:
+        """Count adjacent repeated words (any word, not just a fixed list)"""
+        return sum(
+            1 for current, following in zip(lowered, lowered[1:])
+            if current == following and len(current) > 2
+        )
+    
     def _check_punctuation_issues(self, content: str) -> int:
         """Check for punctuation issues"""
-        error_count = 0
-        
-        # Multiple spaces
-        error_count += len(re.findall(r'  +', content))
-        
-        # Missing spaces after punctuation
-        error_count += len(re.findall(r'[.!?][A-Za-z]', content))
-        
-        # Incorrect apostrophe usage
-        error_count += len(re.findall(r"its'", content))  # it's vs its
-        
-        # Multiple punctuation
-        error_count += len(re.findall(r'[.!?]{2,}', content))
-        
-        # Space before punctuation
-        error_count += len(re.findall(r' [.!?:;,]', content))
-        
-        return error_count
+        return sum(len(pattern.findall(content)) for pattern in _PUNCT_RES)
     
     def _check_capitalization_issues(self, content: str) -> int:
         """Check for capitalization issues"""
-        error_count = 0
+        return self._check_sentences(content)[0]
+    
+    def _check_sentences(self, content: str) -> Tuple[int, int]:
+        """Count lowercase sentence starts and very long sentences in one pass
         
-        sentences = re.split(r'[.!?]+', content)
+        Returns:
+            Tuple of (capitalization issues, sentences over 40 words)
+        """
+        capitalization_issues = 0
+        long_sentences = 0
         
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if sentence and len(sentence) > 1:
-                # Check if sentence starts with lowercase (excluding quotes, etc.)
-                first_word = re.match(r'^["\'\s]*([a-zA-Z])', sentence)
-                if first_word and first_word.group(1).islower():
-                    # Check if it's not a continuation or special case
-                    if not sentence.startswith(('e.g.', 'i.e.', 'etc.')):
-                        error_count += 1
+        for match in _SENT_RE.finditer(content):
+            sentence = match.group()
+            
+            # 41 words need at least 81 characters, so short sentences skip the split
+            if len(sentence) > 80 and len(sentence.split()) > 40:
+                long_sentences += 1
+            
+            # Check if sentence starts with lowercase (excluding quotes, etc.); the
+            # start pattern skips leading whitespace, so only hits need stripping
+            first_word = _SENTENCE_START_RE.match(sentence)
+            if first_word and first_word.group(1).islower() and len(sentence.strip()) > 1:
+                capitalization_issues += 1
         
-        return error_count
+        return capitalization_issues, long_sentences
     
     def _check_common_grammar_mistakes(self, content: str) -> int:
         """Check for common grammatical mistakes"""
-        error_count = 0
-        
-        # Common grammar mistake patterns
-        grammar_patterns = [
-            r'\byour\s+welcome\b',        # you're welcome
-            r'\bits\s+going\b',           # it's going
-            r'\bwould\s+of\b',           # would have
-            r'\bcould\s+of\b',           # could have
-            r'\bshould\s+of\b',          # should have
-            r'\bthere\s+going\b',        # they're going
-            r'\bto\s+much\b',            # too much
-            r'\balot\b',                 # a lot
-        ]
-        
-        for pattern in grammar_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            error_count += len(matches)
-        
-        return error_count
+        return self._count_grammar_mistakes([word.lower() for word in content.split()])
     
     def _check_style_issues(self, content: str) -> int:
         """Check for style and readability issues"""
-        error_count = 0
-        
-        # Very long sentences (over 40 words)
-        sentences = re.split(r'[.!?]+', content)
-        for sentence in sentences:
-            words = sentence.split()
-            if len(words) > 40:
-                error_count += 1
+        error_count = self._count_long_sentences(content)
         
         # Excessive use of passive voice (basic check)
-        passive_patterns = [
-            r'\bwas\s+\w+ed\b',
-            r'\bwere\s+\w+ed\b',
-            r'\bis\s+\w+ed\b',
-            r'\bare\s+\w+ed\b',
-        ]
-        
-        for pattern in passive_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            error_count += len(matches) * 0.5  # Half weight for style issues
+        error_count += len(_PASSIVE_RE.findall(content)) * 0.5  # Half weight for style issues
         
         return int(error_count)
     
+    def _count_long_sentences(self, content: str) -> int:
+        """Count very long sentences (over 40 words)"""
+        return self._check_sentences(content)[1]
+    
+    def _content_key(self, content: str) -> bytes:
+        """Hash content into a compact cache key"""
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+    
+    def _cache_get(self, cache: OrderedDict, key: bytes):
+        """Return a cached result and mark it as recently used, or None"""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+    
+    def _cache_put(self, cache: OrderedDict, key: bytes, value) -> None:
+        """Store a result, evicting the least recently used entry when full"""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.RESULT_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+    
     def _error_rate_to_rating(self, error_rate: float) -> str:
         """Convert error rate to quality rating"""
         if error_rate < 0.01:
@@ -288,15 +657,14 @@ Text to analyze:
             return "Very Poor"
     
     def _split_content(self, content: str, max_words: int = 800) -> List[str]:
-        """Split content into chunks for processing"""
-        words = content.split()
-        chunks = []
-        
-        for i in range(0, len(words), max_words):
-            chunk_words = words[i:i + max_words]
-            chunks.append(' '.join(chunk_words))
+        """Split content into chunks for processing by slicing at word offsets"""
+        offsets = [
+            match.start() for index, match in enumerate(_TOKEN_RE.finditer(content))
+            if index % max_words == 0
+        ]
+        ends = offsets[1:] + [len(content)]
         
-        return chunks
+        return [content[start:end].strip() for start, end in zip(offsets, ends)]
     
     async def get_detailed_analysis(self, content: str) -> Dict:
         """Get detailed grammar and style analysis"""
@@ -309,92 +677,70 @@ Text to analyze:
                 'recommendations': ['No content to analyze']
             }
         
+        cache_key = self._content_key(content)
+        cached = self._cache_get(self._analysis_cache, cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        # Tokenize once and share the word list with every check
+        words = content.split()
+        word_count = len(words)
+        
+        # The same fast path as evaluate(), so both report the same rating for clean snippets
+        if self._is_obviously_clean(content, words):
+            return {
+                'rating': 'Excellent',
+                'error_rate': 0.0,
+                'word_count': word_count,
+                'issues_found': [],
+                'recommendations': self._generate_recommendations('Excellent', 0.0, [])
+            }
+        
         try:
-            word_count = len(content.split())
-            
             if self.use_llm and self.openai_client:
-                error_rate = await self._llm_grammar_check(content)
-                issues = await self._get_detailed_llm_analysis(content)
+                # One call per chunk returns both the error counts and the issues
+                error_rate, issues, complete = await self._llm_full_analysis(content, words)
             else:
-                error_rate = self._rule_based_grammar_check(content)
-                issues = self._get_rule_based_issues(content)
+                counts = await self._run_rules(self._rule_based_counts, content, words)
+                error_rate = self._rule_based_grammar_check(content, words, counts)
+                issues = self._get_rule_based_issues(content, counts)
+                complete = True
             
             rating = self._error_rate_to_rating(error_rate)
             recommendations = self._generate_recommendations(rating, error_rate, issues)
             
-            return {
+            result = {
                 'rating': rating,
                 'error_rate': round(error_rate, 4),
                 'word_count': word_count,
                 'issues_found': issues,
                 'recommendations': recommendations
             }
+            # Analyses degraded by an LLM fallback are not cached, so the next call retries the API
+            if complete:
+                self._cache_put(self._analysis_cache, cache_key, result)
+            return copy.deepcopy(result)
             
         except Exception as e:
             # Fallback analysis
-            error_rate = self._basic_grammar_check(content)
+            error_rate = self._basic_grammar_check(content, words)
             rating = self._error_rate_to_rating(error_rate)
             
             return {
                 'rating': rating,
                 'error_rate': round(error_rate, 4),
-                'word_count': len(content.split()),
+                'word_count': word_count,
                 'issues_found': ['Analysis error occurred'],
                 'recommendations': ['Manual review recommended'],
                 'error': str(e)
             }
     
-    async def _get_detailed_llm_analysis(self, content: str) -> List[str]:
-        """Get detailed issues list from LLM"""
-        try:
-            sample = content[:1000] if len(content) > 1000 else content
-            
-            prompt = f"""Analyze this text and list the main grammar, spelling, and style issues found. Be specific but concise.
-
-Text: {sample}
-
-List issues as bullet points:"""
-            
-            response = await asyncio.to_thread(
-                self.openai_client.chat.completions.create,
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a professional editor. List specific issues found in the text."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=300,
-                temperature=0.1
-            )
-            
-            issues_text = response.choices[0].message.content
-            issues = [line.strip().lstrip('•-*') for line in issues_text.split('\n') if line.strip()]
-            
-            return issues[:10]  # Limit to top 10 issues
-            
-        except Exception:
-            return []
-    
-    def _get_rule_based_issues(self, content: str) -> List[str]:
+    def _get_rule_based_issues(self, content: str, counts: Optional[Dict[str, int]] = None) -> List[str]:
         """Get issues from rule-based analysis"""
-        issues = []
-        
-        # Check for various issue types
-        if self._check_spelling_patterns(content) > 0:
-            issues.append("Potential spelling errors detected")
-        
-        if self._check_punctuation_issues(content) > 0:
-            issues.append("Punctuation issues found")
-        
-        if self._check_capitalization_issues(content) > 0:
-            issues.append("Capitalization errors detected")
-        
-        if self._check_common_grammar_mistakes(content) > 0:
-            issues.append("Common grammar mistakes found")
-        
-        if self._check_style_issues(content) > 0:
-            issues.append("Style and readability issues detected")
+        if counts is None:
+            counts = self._rule_based_counts(content)
         
-        return issues
+        return [message for category, message in _RULE_ISSUE_MESSAGES if counts[category] > 0]
     
     def _generate_recommendations(self, rating: str, error_rate: float, issues: List[str]) -> List[str]:
         """Generate improvement recommendations"""
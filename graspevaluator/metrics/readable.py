@@ -2,24 +2,129 @@
 Readable metric evaluator - Reading level assessment
 """
 
-import textstat
-from typing import Dict, List
+import copy
+import hashlib
+import logging
+import re
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Tokenization matching textstat's counts: a word is a whitespace-separated token
+# with at least one word character left after punctuation removal, a letter is a
+# word character, and sentences are split the way textstat.sentence_count does
+_WORD_RE = re.compile(r'(?<!\S)\S*?\w\S*')
+_LETTERS_RE = re.compile(r'\w+')
+_SENTENCE_RE = re.compile(r'\b[^.!?]+[.!?]*')
+
+# Analysis descriptions, indexed by bisecting the score into the bounds
+_GRADE_BOUNDS = (6, 8, 12, 16)
+_GRADE_DESCRIPTIONS = (
+    "Elementary school level",
+    "Middle school level",
+    "High school level",
+    "College level",
+    "Graduate level"
+)
+_EASE_BOUNDS = (30, 50, 60, 70, 80, 90)
+_EASE_DESCRIPTIONS = (
+    "Very difficult to read",
+    "Difficult to read",
+    "Fairly difficult to read",
+    "Standard reading level",
+    "Fairly easy to read",
+    "Easy to read",
+    "Very easy to read"
+)
+
+# Recommendation templates that never change between calls; _from_template deep-copies
+# one and fills in the per-call "issue" text, so callers own every nested value
+_REC_READABILITY_OPTIMIZATION = {
+    "priority": "low",
+    "category": "readability_optimization",
+    "issue": "Content reading level is appropriate but can be optimized",
+    "impact": "Opportunity to improve user experience",
+    "action": "Fine-tune readability for optimal user engagement",
+    "implementation": {
+        "effort": "low",
+        "timeline": "1 day",
+        "steps": [
+            "Review sentence variety (mix of short and medium sentences)",
+            "Ensure consistent terminology throughout",
+            "Add formatting (bold, italics) for emphasis",
+            "Include visual breaks with lists or subheadings"
+        ]
+    }
+}
+
+_REC_SENTENCE_STRUCTURE = {
+    "priority": "medium",
+    "category": "sentence_structure",
+    "impact": "Readers may abandon content due to complexity",
+    "action": "Improve sentence structure and flow",
+    "implementation": {
+        "effort": "low",
+        "timeline": "1-2 days",
+        "specific_actions": [
+            "Use bullet points for complex information",
+            "Add subheadings to break up dense text",
+            "Use parallel sentence structures",
+            "Include examples and analogies"
+        ]
+    }
+}
+
+_REC_SENTENCE_LENGTH = {
+    "priority": "medium",
+    "category": "sentence_length",
+    "impact": "Long sentences reduce comprehension",
+    "action": "Break down long sentences",
+    "implementation": {
+        "effort": "low",
+        "timeline": "1 day",
+        "target": "Reduce average sentence length to 15-20 words"
+    }
+}
+
+
+def _from_template(template: Mapping, **fields) -> Dict:
+    """Build a recommendation from a template plus per-call fields, sharing nothing with the template"""
+    recommendation = copy.deepcopy(dict(template))
+    recommendation.update(fields)
+    return recommendation
 
 
 class ReadableEvaluator:
     """Evaluate content readability for target audience"""
     
+    __slots__ = ('config', '_scores_cache')
+    
+    SCORES_CACHE_MAX_ENTRIES = 512
+    # Grade-level formulas are meaningless below this many words
+    MIN_EVALUATION_WORDS = 10
+    
+    # Define target level mappings (shared and read-only across instances)
+    target_levels = MappingProxyType({
+        'elementary': (3, 6),      # Grades 3-6
+        'high_school': (7, 12),    # Grades 7-12
+        'college': (13, 16),       # Grades 13-16
+        'graduate': (17, 20),      # Grades 17+
+        'general_public': (6, 8)   # General public (Grade 6-8)
+    })
+    # Range used for unknown target levels
+    DEFAULT_TARGET_RANGE = (6, 8)
+    
     def __init__(self, config):
         self.config = config
         
-        # Define target level mappings
-        self.target_levels = {
-            'elementary': (3, 6),      # Grades 3-6
-            'high_school': (7, 12),    # Grades 7-12
-            'college': (13, 16),       # Grades 13-16
-            'graduate': (17, 20),      # Grades 17+
-            'general_public': (6, 8)   # General public (Grade 6-8)
-        }
+        # LRU cache of textstat results keyed by content hash; evaluate, detailed scores
+        # and recommendations all score the same content
+        self._scores_cache: "OrderedDict[bytes, Tuple]" = OrderedDict()
     
     def evaluate(self, content: str, target_level: str = 'general_public') -> bool:
         """
@@ -32,41 +137,84 @@ class ReadableEvaluator:
         Returns:
             bool: True if content is appropriate for target level
         """
-        if not content or not content.strip():
+        avg_grade_level = self._average_grade_level(content)
+        if avg_grade_level is None:
             return False
         
-        try:
-            # Calculate multiple readability scores
-            flesch_kincaid = textstat.flesch_kincaid_grade(content)
-            gunning_fog = textstat.gunning_fog(content)
-            coleman_liau = textstat.coleman_liau_index(content)
-            
-            # Calculate average grade level
-            scores = [flesch_kincaid, gunning_fog, coleman_liau]
-            # Filter out invalid scores (negative or extremely high)
-            valid_scores = [score for score in scores if 0 <= score <= 25]
-            
-            if not valid_scores:
-                return False
-            
-            avg_grade_level = sum(valid_scores) / len(valid_scores)
-            
-            # Get target range
-            target_range = self.target_levels.get(target_level, (6, 8))
-            
-            # Check if average score is within acceptable range
-            # Allow some tolerance (±1 grade level)
-            min_grade = target_range[0] - 1
-            max_grade = target_range[1] + 1
-            
-            return min_grade <= avg_grade_level <= max_grade
+        return self._is_in_range(avg_grade_level, self._target_range(target_level))
+    
+    def evaluate_batch(self, contents: List[str], target_level: str = 'general_public') -> List[bool]:
+        """
+        Evaluate many documents against the same target reading level
+        
+        Args:
+            contents: Text contents to evaluate
+            target_level: Target audience level
             
+        Returns:
+            List[bool]: Appropriateness flags in the same order as contents
+        """
+        # Resolve the target range once for the whole corpus
+        target_range = self._target_range(target_level)
+        
+        results = []
+        for content in contents:
+            avg_grade_level = self._average_grade_level(content)
+            results.append(avg_grade_level is not None and self._is_in_range(avg_grade_level, target_range))
+        
+        return results
+    
+    def _average_grade_level(self, content: str) -> Optional[float]:
+        """Average of the valid grade-level scores, or None when the content cannot be graded"""
+        if not content or not content.strip():
+            return None
+        
+        # Stops scanning as soon as enough words are seen
+        if len(list(islice(_WORD_RE.finditer(content), self.MIN_EVALUATION_WORDS))) < self.MIN_EVALUATION_WORDS:
+            return None
+        
+        # Only textstat's dictionary lookups can fail; the formulas guard their own divisions
+        try:
+            # Calculate multiple readability scores. All three come from the same cached
+            # primitive counts, so there is nothing to save by deciding on one score alone
+            flesch_kincaid, gunning_fog, coleman_liau = self._compute_scores(content)[:3]
         except Exception as e:
-            # If readability calculation fails, return False
-            return False
+            # If readability calculation fails, the content cannot be graded
+            logger.warning("Readability scoring failed, content left ungraded: %s", e)
+            return None
+        
+        # Calculate average grade level
+        scores = [flesch_kincaid, gunning_fog, coleman_liau]
+        # Filter out invalid scores (negative or extremely high)
+        valid_scores = [score for score in scores if 0 <= score <= 25]
+        
+        if not valid_scores:
+            return None
+        
+        return sum(valid_scores) / len(valid_scores)
+    
+    def _target_range(self, target_level: str) -> Tuple[int, int]:
+        """Grade range for a target audience level, falling back to the general public range"""
+        return self.target_levels.get(target_level, self.DEFAULT_TARGET_RANGE)
+    
+    def _is_in_range(self, avg_grade_level: float, target_range: Tuple[int, int]) -> bool:
+        """Check a grade level against the target range, allowing ±1 grade level of tolerance"""
+        min_grade = target_range[0] - 1
+        max_grade = target_range[1] + 1
+        
+        return min_grade <= avg_grade_level <= max_grade
     
     def get_detailed_scores(self, content: str) -> Dict:
         """Get detailed readability scores and analysis"""
+        return self._detailed_scores(content)[0]
+    
+    def _detailed_scores(self, content: str) -> Tuple[Dict, float, float]:
+        """
+        Build the detailed scores dict, keeping the unrounded values needed for further math
+        
+        Returns:
+            Tuple of (detailed scores, raw average grade level, raw Flesch reading ease)
+        """
         if not content or not content.strip():
             return {
                 'flesch_kincaid': 0,
@@ -77,38 +225,13 @@ class ReadableEvaluator:
                 'word_count': 0,
                 'sentence_count': 0,
                 'analysis': 'No content to analyze'
-            }
+            }, 0.0, 0.0
         
+        # Only textstat's dictionary lookups can fail; the formulas guard their own divisions
         try:
-            # Calculate various readability metrics
-            flesch_kincaid = textstat.flesch_kincaid_grade(content)
-            gunning_fog = textstat.gunning_fog(content)
-            coleman_liau = textstat.coleman_liau_index(content)
-            flesch_reading_ease = textstat.flesch_reading_ease(content)
-            
-            # Basic text statistics
-            word_count = textstat.lexicon_count(content)
-            sentence_count = textstat.sentence_count(content)
-            
-            # Calculate average grade level
-            grade_scores = [flesch_kincaid, gunning_fog, coleman_liau]
-            valid_scores = [score for score in grade_scores if 0 <= score <= 25]
-            avg_grade_level = sum(valid_scores) / len(valid_scores) if valid_scores else 0
-            
-            # Generate analysis
-            analysis = self._generate_analysis(avg_grade_level, flesch_reading_ease)
-            
-            return {
-                'flesch_kincaid': round(flesch_kincaid, 1),
-                'gunning_fog': round(gunning_fog, 1),
-                'coleman_liau': round(coleman_liau, 1),
-                'average_grade_level': round(avg_grade_level, 1),
-                'flesch_reading_ease': round(flesch_reading_ease, 1),
-                'word_count': word_count,
-                'sentence_count': sentence_count,
-                'analysis': analysis
-            }
-            
+            # Calculate various readability metrics and basic text statistics
+            (flesch_kincaid, gunning_fog, coleman_liau, flesch_reading_ease,
+             word_count, sentence_count) = self._compute_scores(content)
         except Exception as e:
             return {
                 'error': f"Error calculating readability: {str(e)}",
@@ -120,47 +243,143 @@ class ReadableEvaluator:
                 'word_count': 0,
                 'sentence_count': 0,
                 'analysis': 'Error in analysis'
-            }
+            }, 0.0, 0.0
+        
+        # Calculate average grade level
+        grade_scores = [flesch_kincaid, gunning_fog, coleman_liau]
+        valid_scores = [score for score in grade_scores if 0 <= score <= 25]
+        avg_grade_level = sum(valid_scores) / len(valid_scores) if valid_scores else 0
+        
+        # Generate analysis
+        analysis = self._generate_analysis(avg_grade_level, flesch_reading_ease)
+        
+        return {
+            'flesch_kincaid': round(flesch_kincaid, 1),
+            'gunning_fog': round(gunning_fog, 1),
+            'coleman_liau': round(coleman_liau, 1),
+            'average_grade_level': round(avg_grade_level, 1),
+            'flesch_reading_ease': round(flesch_reading_ease, 1),
+            'word_count': word_count,
+            'sentence_count': sentence_count,
+            'analysis': analysis
+        }, avg_grade_level, flesch_reading_ease
     
-    def _generate_analysis(self, grade_level: float, reading_ease: float) -> str:
-        """Generate human-readable analysis of readability"""
-        # Grade level analysis
-        if grade_level <= 6:
-            grade_desc = "Elementary school level"
-        elif grade_level <= 8:
-            grade_desc = "Middle school level"
-        elif grade_level <= 12:
-            grade_desc = "High school level"
-        elif grade_level <= 16:
-            grade_desc = "College level"
+    def _compute_scores(self, content: str) -> Tuple[float, float, float, float, int, int]:
+        """
+        Compute textstat scores once per distinct content
+        
+        Returns:
+            Tuple of (flesch_kincaid, gunning_fog, coleman_liau, flesch_reading_ease,
+            word_count, sentence_count)
+        """
+        key = hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+        scores = self._scores_cache.get(key)
+        if scores is not None:
+            self._scores_cache.move_to_end(key)
+            return scores
+        
+        words, sentences, syllables, letters, difficult_words = self._count_primitives(content)
+        
+        # All four formulas are closed-form over the same counts, so evaluate them
+        # inline instead of letting each textstat call re-tokenize the content
+        words_per_sentence = words / sentences if sentences else 0.0
+        syllables_per_word = syllables / words if words else 0.0
+        letters_per_100_words = letters / words * 100 if words else 0.0
+        sentences_per_100_words = sentences / words * 100 if words else 0.0
+        
+        if words_per_sentence == 0 or syllables_per_word == 0:
+            flesch_kincaid = 0.0
+            flesch_reading_ease = 0.0
         else:
-            grade_desc = "Graduate level"
-        
-        # Reading ease analysis
-        if reading_ease >= 90:
-            ease_desc = "Very easy to read"
-        elif reading_ease >= 80:
-            ease_desc = "Easy to read"
-        elif reading_ease >= 70:
-            ease_desc = "Fairly easy to read"
-        elif reading_ease >= 60:
-            ease_desc = "Standard reading level"
-        elif reading_ease >= 50:
-            ease_desc = "Fairly difficult to read"
-        elif reading_ease >= 30:
-            ease_desc = "Difficult to read"
+            flesch_kincaid = (0.39 * words_per_sentence) + (11.8 * syllables_per_word) - 15.59
+            flesch_reading_ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+        
+        gunning_fog = 0.4 * (words_per_sentence + 100 * difficult_words / words) if words else 0.0
+        
+        if letters_per_100_words == 0 or sentences_per_100_words == 0:
+            coleman_liau = 0.0
         else:
-            ease_desc = "Very difficult to read"
+            coleman_liau = (0.058 * letters_per_100_words) - (0.296 * sentences_per_100_words) - 15.8
+        
+        scores = (flesch_kincaid, gunning_fog, coleman_liau, flesch_reading_ease, words, sentences)
+        
+        self._scores_cache[key] = scores
+        while len(self._scores_cache) > self.SCORES_CACHE_MAX_ENTRIES:
+            self._scores_cache.popitem(last=False)
+        return scores
+    
+    def _count_primitives(self, content: str) -> Tuple[int, int, int, int, int]:
+        """
+        Count the text primitives the readability formulas are built from
+        
+        Returns:
+            Tuple of (words, sentences, syllables, letters, difficult words of 3+ syllables)
+        """
+        syllables, difficult_words = self._count_syllables(content)
+        
+        return (
+            len(_WORD_RE.findall(content)),
+            self._count_sentences(content),
+            syllables,
+            sum(map(len, _LETTERS_RE.findall(content))),
+            difficult_words
+        )
+    
+    def _count_sentences(self, content: str) -> int:
+        """Count sentences, ignoring fragments of two words or fewer"""
+        if not content:
+            return 0
+        
+        sentences = _SENTENCE_RE.findall(content)
+        ignored = sum(1 for sentence in sentences if len(_WORD_RE.findall(sentence)) <= 2)
+        return max(1, len(sentences) - ignored)
+    
+    def _count_syllables(self, content: str) -> Tuple[int, int]:
+        """
+        Count syllables and difficult words once per distinct token
+        
+        Punctuation stripping never splits or merges whitespace-separated tokens, so
+        per-token counts weighted by frequency equal textstat's whole-text counts.
+        
+        Returns:
+            Tuple of (total syllables, difficult words of 3+ syllables)
+        """
+        # textstat loads its pronunciation and hyphenation dictionaries on import, so
+        # only pay for that once readability is actually scored
+        import textstat
+        
+        syllable_count = textstat.syllable_count
+        syllables = 0
+        difficult_words = 0
+        
+        for token, frequency in Counter(content.lower().split()).items():
+            token_syllables = syllable_count(token)
+            syllables += frequency * token_syllables
+            
+            # Difficult words need at least three syllables; only those pay for the easy-word check
+            if token_syllables >= 3:
+                difficult_words += frequency * textstat.difficult_words(token, syllable_threshold=3, unique=False)
+        
+        return syllables, difficult_words
+    
+    def _generate_analysis(self, grade_level: float, reading_ease: float) -> str:
+        """Generate human-readable analysis of readability"""
+        # Grade levels are upper-inclusive, reading ease bounds are lower-inclusive
+        grade_desc = _GRADE_DESCRIPTIONS[bisect_left(_GRADE_BOUNDS, grade_level)]
+        ease_desc = _EASE_DESCRIPTIONS[bisect_right(_EASE_BOUNDS, reading_ease)]
         
         return f"{grade_desc}. {ease_desc}."
     
     def check_target_alignment(self, content: str, target_level: str) -> Dict:
         """Check how well content aligns with target reading level"""
-        scores = self.get_detailed_scores(content)
-        is_appropriate = self.evaluate(content, target_level)
+        # Deviation is measured from the unrounded grade level and rounded only for output
+        scores, current_level, _ = self._detailed_scores(content)
         
-        target_range = self.target_levels.get(target_level, (6, 8))
-        current_level = scores.get('average_grade_level', 0)
+        target_range = self._target_range(target_level)
+        
+        # Judge the same grade level that is reported, rather than scoring the content again
+        is_appropriate = (scores.get('word_count', 0) >= self.MIN_EVALUATION_WORDS
+                          and self._is_in_range(current_level, target_range))
         
         # Calculate how far off the target we are
         if current_level < target_range[0]:
@@ -175,40 +394,61 @@ class ReadableEvaluator:
         
         return {
             'is_appropriate': is_appropriate,
-            'current_level': current_level,
+            'current_level': round(current_level, 1),
             'target_range': target_range,
             'deviation': round(deviation, 1),
             'recommendation': recommendation,
             'detailed_scores': scores
         }
     
-    async def generate_enhanced_recommendations(self, content: str, target_level: str, is_appropriate: bool) -> List[Dict]:
-        """Generate detailed, actionable recommendations for readability improvements"""
-        recommendations = []
+    def generate_enhanced_recommendations(self, content: str, target_level: str, is_appropriate: bool,
+                                          scores: Optional[Dict] = None) -> List[Dict]:
+        """
+        Generate detailed, actionable recommendations for readability improvements
         
-        scores = self.get_detailed_scores(content)
-        current_level = scores.get('average_grade_level', 0)
-        target_range = self.target_levels.get(target_level, (6, 8))
+        Args:
+            content: Text content to analyze
+            target_level: Target audience level
+            is_appropriate: Whether the content already matches the target level
+            scores: Result of get_detailed_scores for this content, if already computed
+            
+        Returns:
+            List of recommendation dicts
+        """
+        return list(self.iter_enhanced_recommendations(content, target_level, is_appropriate, scores))
+    
+    def iter_enhanced_recommendations(self, content: str, target_level: str, is_appropriate: bool,
+                                      scores: Optional[Dict] = None) -> Iterator[Dict]:
+        """Yield readability recommendations lazily, in the same order as generate_enhanced_recommendations"""
+        if scores is None:
+            scores, current_level, reading_ease = self._detailed_scores(content)
+        else:
+            current_level = scores.get('average_grade_level', 0)
+            reading_ease = scores.get('flesch_reading_ease', 0)
+        word_count = scores.get('word_count', 0)
+        sentence_count = scores.get('sentence_count', 0)
+        target_min, target_max = self._target_range(target_level)
+        target_range_text = f"{target_min}-{target_max}"
         
         if not is_appropriate:
-            if current_level > target_range[1]:
+            if current_level > target_max:
                 # Content is too complex
-                deviation = current_level - target_range[1]
+                deviation = current_level - target_max
                 severity = "critical" if deviation > 3 else "high" if deviation > 1.5 else "medium"
                 
-                recommendations.append({
+                yield {
                     "priority": severity,
                     "category": "complexity_reduction",
-                    "issue": f"Content reading level ({current_level:.1f}) exceeds target ({target_level}: {target_range[0]}-{target_range[1]})",
+                    "issue": f"Content reading level ({current_level:.1f}) exceeds target ({target_level}: {target_range_text})",
                     "impact": "10% weight metric - readers may struggle to understand content",
                     "action": "Simplify content to match target audience reading level",
                     "specifics": {
-                        "current_grade_level": current_level,
-                        "target_range": f"{target_range[0]}-{target_range[1]}",
+                        "current_grade_level": round(current_level, 1),
+                        "target_range": target_range_text,
                         "deviation": f"+{deviation:.1f} grade levels",
-                        "flesch_reading_ease": scores.get('flesch_reading_ease', 0),
-                        "word_count": scores.get('word_count', 0),
-                        "sentence_count": scores.get('sentence_count', 0)
+                        "flesch_reading_ease": round(reading_ease, 1),
+                        "word_count": word_count,
+                        "sentence_count": sentence_count
                     },
                     "implementation": {
                         "effort": "medium",
@@ -223,44 +463,31 @@ class ReadableEvaluator:
                         "specific_targets": [
                             f"Reduce average sentence length to 15-20 words",
                             f"Target Flesch Reading Ease score of 60-70",
-                            f"Aim for grade level {target_range[1]:.0f} or lower"
+                            f"Aim for grade level {target_max} or lower"
                         ]
                     }
-                })
+                }
                 
                 # Additional recommendations based on specific metrics
-                if scores.get('flesch_reading_ease', 0) < 50:
-                    recommendations.append({
-                        "priority": "medium",
-                        "category": "sentence_structure",
-                        "issue": f"Low reading ease score ({scores.get('flesch_reading_ease', 0):.1f}) indicates difficult sentence structure",
-                        "impact": "Readers may abandon content due to complexity",
-                        "action": "Improve sentence structure and flow",
-                        "implementation": {
-                            "effort": "low",
-                            "timeline": "1-2 days",
-                            "specific_actions": [
-                                "Use bullet points for complex information",
-                                "Add subheadings to break up dense text",
-                                "Use parallel sentence structures",
-                                "Include examples and analogies"
-                            ]
-                        }
-                    })
+                if reading_ease < 50:
+                    yield _from_template(
+                        _REC_SENTENCE_STRUCTURE,
+                        issue=f"Low reading ease score ({reading_ease:.1f}) indicates difficult sentence structure"
+                    )
             
-            elif current_level < target_range[0]:
+            elif current_level < target_min:
                 # Content is too simple
-                deviation = target_range[0] - current_level
+                deviation = target_min - current_level
                 
-                recommendations.append({
+                yield {
                     "priority": "medium",
                     "category": "sophistication_increase",
-                    "issue": f"Content reading level ({current_level:.1f}) is below target ({target_level}: {target_range[0]}-{target_range[1]})",
+                    "issue": f"Content reading level ({current_level:.1f}) is below target ({target_level}: {target_range_text})",
                     "impact": "May appear unprofessional or lack depth for target audience",
                     "action": "Increase content sophistication appropriately",
                     "specifics": {
-                        "current_grade_level": current_level,
-                        "target_range": f"{target_range[0]}-{target_range[1]}",
+                        "current_grade_level": round(current_level, 1),
+                        "target_range": target_range_text,
                         "deviation": f"-{deviation:.1f} grade levels"
                     },
                     "implementation": {
@@ -273,43 +500,17 @@ class ReadableEvaluator:
                             "Incorporate complex sentence structures occasionally"
                         ]
                     }
-                })
+                }
         
         else:
             # Content is appropriate but could be optimized
-            recommendations.append({
-                "priority": "low",
-                "category": "readability_optimization",
-                "issue": "Content reading level is appropriate but can be optimized",
-                "impact": "Opportunity to improve user experience",
-                "action": "Fine-tune readability for optimal user engagement",
-                "implementation": {
-                    "effort": "low",
-                    "timeline": "1 day",
-                    "steps": [
-                        "Review sentence variety (mix of short and medium sentences)",
-                        "Ensure consistent terminology throughout",
-                        "Add formatting (bold, italics) for emphasis",
-                        "Include visual breaks with lists or subheadings"
-                    ]
-                }
-            })
+            yield _from_template(_REC_READABILITY_OPTIMIZATION)
         
         # Content-specific recommendations based on detailed scores
-        if scores.get('sentence_count', 0) > 0:
-            avg_words_per_sentence = scores.get('word_count', 0) / scores.get('sentence_count', 1)
+        if sentence_count > 0:
+            avg_words_per_sentence = word_count / sentence_count
             if avg_words_per_sentence > 25:
-                recommendations.append({
-                    "priority": "medium",
-                    "category": "sentence_length",
-                    "issue": f"Average sentence length is {avg_words_per_sentence:.1f} words (ideal: 15-20)",
-                    "impact": "Long sentences reduce comprehension",
-                    "action": "Break down long sentences",
-                    "implementation": {
-                        "effort": "low",
-                        "timeline": "1 day",
-                        "target": "Reduce average sentence length to 15-20 words"
-                    }
-                })
-        
-        return recommendations
\ No newline at end of file
+                yield _from_template(
+                    _REC_SENTENCE_LENGTH,
+                    issue=f"Average sentence length is {avg_words_per_sentence:.1f} words (ideal: 15-20)"
+                )
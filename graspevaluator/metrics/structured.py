@@ -2,24 +2,285 @@
 Structured metric evaluator - HTML structure assessment
 """
 
+import copy
+import hashlib
 import re
-from typing import Dict, List
-from bs4 import BeautifulSoup
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+import lxml.html
+import orjson
+from lxml import etree
+
+
+# lxml rejects str input that still carries an XML encoding declaration
+_XML_DECLARATION_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+# Raw HTML bodies, as text or as the undecoded bytes a fetcher received
+HtmlInput = Union[str, bytes, memoryview]
+
+# Byte input is left to libxml2's own charset detection only when the document declares one
+_CHARSET_DECLARATION_RE = re.compile(rb'<meta[^>]+charset|<\?xml[^>]+encoding', re.IGNORECASE)
+_CHARSET_SNIFF_BYTES = 1024
+# Without a declaration libxml2 assumes Latin-1, so undeclared bytes are read as UTF-8
+_UTF8_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+# Strings inside these elements are not page text (mirrors BeautifulSoup's get_text)
+_NON_TEXT_TAGS = frozenset(('script', 'style', 'template', 'rt', 'rp'))
+
+# Element classes the single-pass scan sorts tags into
+_HEADING_LEVELS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+# Important semantic elements and their points
+_SEMANTIC_POINTS = (
+    ('main', 5),        # Main content area
+    ('article', 4),     # Article content
+    ('section', 3),     # Content sections
+    ('header', 2),      # Page/section headers
+    ('footer', 2),      # Page/section footers
+    ('nav', 2),         # Navigation
+    ('aside', 1),       # Sidebar content
+    ('figure', 1),      # Figures with captions
+    ('figcaption', 1)   # Figure captions
+)
+# Bonus points for using several semantic elements, as (minimum found, bonus), highest first
+_SEMANTIC_BONUS_THRESHOLDS = ((5, 3), (3, 2), (2, 1))
+_SEMANTIC_TAGS = frozenset(tag for tag, _ in _SEMANTIC_POINTS)
+_LIST_TAGS = frozenset(('ul', 'ol', 'dl'))
+_QUOTE_CODE_TAGS = frozenset(('blockquote', 'code', 'pre'))
+# Social meta markers as (scan count key, meta attribute, marker). Markers match anywhere in the
+# attribute value as the original regex search did; new families only need a row here
+_META_MARKERS = (
+    ('open_graph', 'property', 'og:'),
+    ('twitter', 'name', 'twitter:')
+)
+_SCAN_TAGS = (tuple(_HEADING_LEVELS) + tuple(_SEMANTIC_TAGS) + tuple(_LIST_TAGS)
+              + tuple(_QUOTE_CODE_TAGS) + ('table', 'th', 'script', 'meta'))
+
+# Structural queries, compiled once and evaluated in C by libxml2
+_XP_LIST_ITEMS = etree.XPath('.//li|.//dt|.//dd')
+# Schema attributes can sit on any element, so they get one attribute query instead of a tag filter
+_XP_SCHEMA_ATTRIBUTES = etree.XPath('//*[@itemscope or @itemtype or @typeof]')
+
+
+# Recommendation templates that never change between calls; _from_template deep-copies one
+# and adds the per-call fields, so callers own every nested dict and list they receive
+_REC_STRUCTURAL_FOUNDATION = MappingProxyType({
+    "priority": "critical",
+    "category": "structural_foundation",
+    "impact": "10% weight metric - poor LLM understanding and SEO impact",
+    "action": "Implement comprehensive structural improvements",
+    "implementation": {
+        "effort": "high",
+        "timeline": "1-2 weeks",
+        "phases": [
+            "Phase 1: Fix heading structure (Week 1)",
+            "Phase 2: Add semantic elements (Week 1-2)",
+            "Phase 3: Implement schema markup (Week 2)"
+        ]
+    }
+})
+
+_REC_HEADING_STRUCTURE = MappingProxyType({
+    "category": "heading_structure",
+    "impact": "Reduced content hierarchy understanding for both users and LLMs",
+    "action": "Implement proper heading hierarchy"
+})
+
+_HEADING_STEPS = (
+    "Create logical heading hierarchy (H1 → H2 → H3)",
+    "Ensure headings describe content sections clearly",
+    "Use 3-10 words per heading for optimal length",
+    "Avoid skipping heading levels (e.g., H1 directly to H3)"
+)
+
+_REC_SEMANTIC_MARKUP = MappingProxyType({
+    "category": "semantic_markup",
+    "impact": "Poor content structure recognition by search engines and screen readers",
+    "action": "Add semantic HTML5 elements to improve content structure",
+    "implementation": {
+        "effort": "medium",
+        "timeline": "2-3 days",
+        "priority_order": [
+            "<main> - Wrap primary content (highest priority)",
+            "<header> - Page/section headers",
+            "<nav> - Navigation areas",
+            "<article> - Standalone content pieces",
+            "<section> - Thematic content groups",
+            "<aside> - Sidebar/supplementary content",
+            "<footer> - Page/section footers"
+        ],
+        "implementation_guide": {
+            "main": "Wrap the primary content area with <main>",
+            "header": "Use for page header, logo, and primary navigation",
+            "nav": "Wrap navigation menus and breadcrumbs",
+            "article": "Use for blog posts, news articles, or standalone content",
+            "section": "Group related content with thematic headings"
+        }
+    }
+})
+
+_REC_DATA_ORGANIZATION = MappingProxyType({
+    "priority": "medium",
+    "category": "data_organization",
+    "impact": "Missed opportunities for better content organization and comprehension",
+    "action": "Implement appropriate data structures for content organization",
+    "implementation": {
+        "effort": "low",
+        "timeline": "1-2 days",
+        "opportunities": [
+            "Convert related items to bulleted lists (<ul>)",
+            "Use numbered lists (<ol>) for sequential steps",
+            "Implement tables for comparative data",
+            "Add table headers (<th>) for accessibility",
+            "Use definition lists (<dl>) for term-definition pairs"
+        ],
+        "specific_actions": [
+            "Identify content that would benefit from list structure",
+            "Add table captions for better accessibility",
+            "Ensure tables have proper header structure",
+            "Consider using <blockquote> for quotations"
+        ]
+    }
+})
+
+_REC_STRUCTURED_DATA = MappingProxyType({
+    "category": "structured_data",
+    "impact": "Poor search engine understanding and reduced rich snippet opportunities",
+    "action": "Implement comprehensive structured data markup",
+    "implementation": {
+        "effort": "medium",
+        "timeline": "3-5 days",
+        "priority_implementations": [
+            "JSON-LD structured data (highest impact)",
+            "Open Graph meta tags for social sharing",
+            "Twitter Card meta tags",
+            "Basic microdata markup"
+        ],
+        "schema_types_to_implement": [
+            "Organization - Company/business information",
+            "Website - Website metadata",
+            "Article - Content pieces",
+            "BreadcrumbList - Navigation hierarchy",
+            "ContactPoint - Contact information"
+        ],
+        "code_examples": {
+            "basic_organization": "Add JSON-LD script with Organization schema",
+            "open_graph": "Add og:title, og:description, og:image meta tags",
+            "twitter_cards": "Add twitter:card, twitter:title meta tags"
+        }
+    }
+})
+
+_REC_STRUCTURAL_OPTIMIZATION = MappingProxyType({
+    "priority": "low",
+    "category": "structural_optimization",
+    "issue": "Good structural foundation with optimization opportunities",
+    "impact": "Fine-tuning can improve LLM understanding and user experience",
+    "action": "Optimize existing structure for maximum effectiveness",
+    "implementation": {
+        "effort": "low",
+        "timeline": "1-2 days",
+        "optimizations": [
+            "Review heading hierarchy for logical flow",
+            "Add missing alt attributes to images",
+            "Ensure all forms have proper labels",
+            "Add ARIA landmarks where beneficial",
+            "Validate HTML for any syntax errors"
+        ]
+    }
+})
+
+
+def _from_template(template: Mapping, **fields) -> Dict:
+    """Build a recommendation from a template plus per-call fields, sharing nothing with the template"""
+    recommendation = copy.deepcopy(dict(template))
+    recommendation.update(fields)
+    return recommendation
+
+
+class _Heading(NamedTuple):
+    """A non-empty heading with the text facts the content check needs"""
+    level: int
+    text: str
+    nwords: int
+    is_digit: bool
+
+
+def _element_text(element: lxml.html.HtmlElement) -> str:
+    """Concatenate the stripped text fragments under an element, skipping scripts, styles and comments"""
+    for ancestor in element.iterancestors():
+        if ancestor.tag in _NON_TEXT_TAGS:
+            return ''
+    
+    parts = []
+    _collect_text(element, parts)
+    return ''.join(part.strip() for part in parts)
+
+
+def _json_ld_types(data) -> List[str]:
+    """Collect every @type value in a parsed JSON-LD document, in document order"""
+    types = []
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            node_type = node.get('@type')
+            if isinstance(node_type, str):
+                types.append(node_type)
+            elif isinstance(node_type, list):
+                types.extend(value for value in node_type if isinstance(value, str))
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return types
+
+
+def _collect_text(element: lxml.html.HtmlElement, parts: List[str]) -> None:
+    """Append an element's text and its descendants' text and tails in document order"""
+    if element.text:
+        parts.append(element.text)
+    
+    for child in element:
+        # Comments and processing instructions have non-string tags; only their tails are text
+        if isinstance(child.tag, str) and child.tag not in _NON_TEXT_TAGS:
+            _collect_text(child, parts)
+        if child.tail:
+            parts.append(child.tail)
 
 
 class StructuredEvaluator:
     """Evaluate semantic HTML structure for LLM consumption"""
     
+    # Parsed trees are large, so only the most recent pages are kept
+    PAGE_CACHE_MAX_ENTRIES = 8
+    RESULT_CACHE_MAX_ENTRIES = 256
+    # Batches smaller than this are rated in-process; a pool costs more to start than it saves
+    BATCH_PARALLEL_MIN_PAGES = 64
+    # Pages sent to a worker per round trip, amortizing pickling and IPC
+    BATCH_CHUNKSIZE = 32
+    
     def __init__(self, config):
         self.config = config
         self.structured_config = config.get_structured_config()
+        
+        # evaluate, detailed analysis and recommendations all parse and scan the same page
+        self._page_cache: "OrderedDict[bytes, Tuple[lxml.html.HtmlElement, Dict]]" = OrderedDict()
+        
+        # LRU caches of ratings and detailed analyses keyed by page hash and enabled checks
+        self._rating_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+        self._analysis_cache: "OrderedDict[Tuple, Dict]" = OrderedDict()
+        
+        # Sites repeat the same JSON-LD blocks on every page, so parsed @type lists are kept by body hash
+        self._json_ld_cache: "OrderedDict[bytes, Tuple[str, ...]]" = OrderedDict()
     
-    def evaluate(self, html: str) -> str:
+    def evaluate(self, html: HtmlInput) -> str:
         """
         Evaluate HTML structure quality
         
         Args:
-            html: HTML content to analyze
+            html: HTML content to analyze, as text or undecoded bytes
             
         Returns:
             str: Structure rating ('Excellent', 'Good', 'Fair', 'Poor', 'Very Poor')
@@ -27,53 +288,235 @@ class StructuredEvaluator:
         if not html:
             return "Very Poor"
         
+        cache_key = self._result_key(html)
+        cached = self._cache_get(self._rating_cache, cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            soup = BeautifulSoup(html, 'lxml')
-            
-            total_score = 0
-            max_score = 100
+            rating = self._rate(self._get_page(html)[1])
+            self._cache_put(self._rating_cache, cache_key, rating)
+            return rating
             
-            # Heading structure (25 points)
-            if self.structured_config.get('check_headings', True):
-                total_score += self._evaluate_headings(soup)
-            
-            # Semantic elements (25 points)
-            if self.structured_config.get('check_semantic_elements', True):
-                total_score += self._evaluate_semantic_elements(soup)
-            
-            # Lists and tables (25 points)
-            total_score += self._evaluate_data_structures(soup)
+        except Exception:
+            return "Poor"
+    
+    def evaluate_batch(self, htmls: Iterable[HtmlInput], *, workers: Optional[int] = None) -> List[str]:
+        """
+        Rate many pages, spreading parsing and scoring across worker processes
+        
+        Args:
+            htmls: HTML documents to rate, as text or undecoded bytes
+            workers: Number of worker processes; defaults to the CPU count
             
-            # Schema markup (25 points)
-            if self.structured_config.get('check_schema_markup', True):
-                total_score += self._evaluate_schema_markup(soup)
+        Returns:
+            List[str]: Structure ratings in the same order as htmls
+        """
+        # memoryviews cannot be pickled to workers
+        pages = [bytes(html) if isinstance(html, memoryview) else html for html in htmls]
+        if workers == 1 or len(pages) < self.BATCH_PARALLEL_MIN_PAGES:
+            return [self.evaluate(html) for html in pages]
+        
+        # Workers build their own evaluator: cached lxml trees cannot cross process boundaries
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(self.config, dict(self.structured_config))) as executor:
+            return list(executor.map(_evaluate_in_batch_worker, pages, chunksize=self.BATCH_CHUNKSIZE))
+    
+    def _rate(self, scan: Dict) -> str:
+        """Score the enabled categories of a scanned page and convert the total to a rating"""
+        # Enabled category scorers (25 points each), cheapest first so that heading
+        # text extraction is the part most often skipped
+        evaluators = []
+        if self.structured_config.get('check_semantic_elements', True):
+            evaluators.append(self._evaluate_semantic_elements)
+        if self.structured_config.get('check_schema_markup', True):
+            evaluators.append(self._evaluate_schema_markup)
+        evaluators.append(self._evaluate_data_structures)
+        if self.structured_config.get('check_headings', True):
+            evaluators.append(self._evaluate_headings)
+        
+        total_score = 0
+        remaining_max = 25 * len(evaluators)
+        
+        for evaluate_category in evaluators:
+            total_score += evaluate_category(scan)
+            remaining_max -= 25
             
-            # Convert to rating
-            return self._score_to_rating(total_score)
+            # Stop once the remaining categories can no longer change the rating
+            rating = self._score_to_rating(total_score)
+            if rating == self._score_to_rating(total_score + remaining_max):
+                return rating
+        
+        # Convert to rating
+        return self._score_to_rating(total_score)
+    
+    def _page_key(self, html: HtmlInput) -> bytes:
+        """Hash HTML into a compact cache key"""
+        if isinstance(html, str):
+            return hashlib.blake2b(html.encode('utf-8'), digest_size=16).digest()
+        
+        # Bytes are hashed in place; the personalization keeps them apart from equal text,
+        # which can parse differently when the bytes declare another charset
+        return hashlib.blake2b(html, digest_size=16, person=b'bytes').digest()
+    
+    def _result_key(self, html: HtmlInput) -> Tuple:
+        """Key a result by page hash and the checks that shaped it"""
+        return (
+            self._page_key(html),
+            self.structured_config.get('check_headings', True),
+            self.structured_config.get('check_semantic_elements', True),
+            self.structured_config.get('check_schema_markup', True)
+        )
+    
+    def _cache_get(self, cache: OrderedDict, key):
+        """Return a cached result and mark it as recently used, or None"""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+    
+    def _cache_put(self, cache: OrderedDict, key, value) -> None:
+        """Store a result, evicting the least recently used entry when full"""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.RESULT_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+    
+    def _get_page(self, html: HtmlInput) -> Tuple[lxml.html.HtmlElement, Dict]:
+        """Parse and scan HTML once per distinct page and reuse both across calls"""
+        key = self._page_key(html)
+        page = self._page_cache.get(key)
+        if page is not None:
+            self._page_cache.move_to_end(key)
+            return page
+        
+        # The whole document is parsed: libxml2 has no tag whitelist, and trimming options
+        # (remove_blank_text, remove_comments) make parsing slower rather than faster. The
+        # scan's tag filter plays the strainer's role, since only matching elements ever
+        # get Python proxies.
+        try:
+            root = self._parse(html)
+        except etree.ParserError:
+            # Blank or comment-only markup has no elements to evaluate
+            root = lxml.html.Element('html')
+        page = (root, self._scan(root))
+        
+        self._page_cache[key] = page
+        while len(self._page_cache) > self.PAGE_CACHE_MAX_ENTRIES:
+            self._page_cache.popitem(last=False)
+        return page
+    
+    def _parse(self, html: HtmlInput) -> lxml.html.HtmlElement:
+        """Parse text or bytes into a document tree, handing bytes to libxml2 without decoding"""
+        if isinstance(html, str):
+            return lxml.html.document_fromstring(_XML_DECLARATION_RE.sub('', html, count=1))
+        
+        if _CHARSET_DECLARATION_RE.search(html[:_CHARSET_SNIFF_BYTES]):
+            return lxml.html.document_fromstring(html)
+        return lxml.html.document_fromstring(html, parser=_UTF8_HTML_PARSER)
+    
+    def _scan(self, root: lxml.html.HtmlElement) -> Dict:
+        """
+        Collect everything the category scores need in one document-order walk
+        
+        Args:
+            root: Parsed document root
             
-        except Exception:
-            return "Poor"
+        Returns:
+            Dict of heading elements per level, semantic tags found, list, table and
+            JSON-LD script elements, item types, and counts of schema markup
+        """
+        headings = ([], [], [], [], [], [])
+        semantic = set()
+        lists = []
+        tables = []
+        has_th = False
+        has_dl = False
+        has_quote_code = False
+        json_ld_scripts = []
+        meta_counts = dict.fromkeys((count_key for count_key, _, _ in _META_MARKERS), 0)
+        
+        # lxml filters tags in C, so only the relevant elements reach Python.
+        # Nearly all of the remaining time is libxml2 traversal and element
+        # proxy creation; the tag dispatch below is a small share of it, so
+        # the loop stays in plain Python rather than a compiled extension.
+        for element in root.iter(*_SCAN_TAGS):
+            tag = element.tag
+            level = _HEADING_LEVELS.get(tag)
+            if level:
+                headings[level - 1].append(element)
+            elif tag in _SEMANTIC_TAGS:
+                semantic.add(tag)
+            elif tag in _LIST_TAGS:
+                lists.append(element)
+                if tag == 'dl':
+                    has_dl = True
+            elif tag == 'table':
+                tables.append(element)
+            elif tag == 'th':
+                has_th = True
+            elif tag in _QUOTE_CODE_TAGS:
+                has_quote_code = True
+            elif tag == 'script':
+                if element.get('type') == 'application/ld+json':
+                    json_ld_scripts.append(element)
+            else:
+                # A plain substring test beats an automaton on attribute values this short
+                for count_key, attribute, marker in _META_MARKERS:
+                    if marker in (element.get(attribute) or ''):
+                        meta_counts[count_key] += 1
+        
+        itemscope = 0
+        itemtype = 0
+        typeof = 0
+        itemtypes = []
+        for element in _XP_SCHEMA_ATTRIBUTES(root):
+            attrib = element.attrib
+            if 'itemscope' in attrib:
+                itemscope += 1
+            if 'itemtype' in attrib:
+                itemtype += 1
+                if attrib['itemtype']:
+                    itemtypes.append(attrib['itemtype'])
+            if 'typeof' in attrib:
+                typeof += 1
+        
+        return {
+            'headings': headings,
+            'semantic': semantic,
+            'lists': lists,
+            'tables': tables,
+            'has_th': has_th,
+            'has_dl': has_dl,
+            'has_quote_code': has_quote_code,
+            'json_ld': len(json_ld_scripts),
+            'json_ld_scripts': json_ld_scripts,
+            'itemscope': itemscope,
+            'itemtype': itemtype,
+            'itemtypes': itemtypes,
+            'typeof': typeof,
+            **meta_counts
+        }
     
-    def _evaluate_headings(self, soup: BeautifulSoup) -> float:
+    def _evaluate_headings(self, scan: Dict) -> float:
         """Evaluate heading structure (max 25 points)"""
         score = 0
         
-        # Find all headings
+        # Find all headings, counting the non-empty ones per level as they are collected
         headings = []
-        for level in range(1, 7):
-            level_headings = soup.find_all(f'h{level}')
+        level_counts = [0] * 7
+        for level, level_headings in enumerate(scan['headings'], 1):
             for heading in level_headings:
-                if heading.get_text(strip=True):
-                    headings.append({
-                        'level': level,
-                        'text': heading.get_text(strip=True)
-                    })
+                text = _element_text(heading)
+                if text:
+                    headings.append(_Heading(level, text, len(text.split()), text.isdigit()))
+                    level_counts[level] += 1
         
         if not headings:
             return 0
         
         # Check for h1 presence (5 points)
-        h1_count = len([h for h in headings if h['level'] == 1])
+        h1_count = level_counts[1]
         if h1_count == 1:
             score += 5
         elif h1_count > 1:
@@ -89,30 +532,23 @@ class StructuredEvaluator:
         
         return min(25, score)
     
-    def _check_heading_hierarchy(self, headings: List[Dict]) -> float:
+    def _check_heading_hierarchy(self, headings: List[_Heading]) -> float:
         """Check if headings follow proper hierarchy"""
         if not headings:
             return 0
         
-        violations = 0
-        total_checks = 0
-        
-        for i, heading in enumerate(headings[1:], 1):
-            prev_level = headings[i-1]['level']
-            curr_level = heading['level']
-            
-            total_checks += 1
-            
-            # Check if heading level jumps more than 1
-            if curr_level > prev_level + 1:
-                violations += 1
+        levels = [heading.level for heading in headings]
+        total_checks = len(levels) - 1
         
         if total_checks == 0:
             return 1.0
         
+        # Count adjacent pairs where the heading level jumps more than 1
+        violations = sum(curr_level - prev_level > 1 for prev_level, curr_level in zip(levels, levels[1:]))
+        
         return max(0, 1 - (violations / total_checks))
     
-    def _check_heading_content(self, headings: List[Dict]) -> float:
+    def _check_heading_content(self, headings: List[_Heading]) -> float:
         """Check heading content quality"""
         if not headings:
             return 0
@@ -120,71 +556,50 @@ class StructuredEvaluator:
         quality_score = 0
         
         for heading in headings:
-            text = heading['text']
+            word_count = heading.nwords
             
             # Check length (not too short, not too long)
-            if 3 <= len(text.split()) <= 10:
+            if 3 <= word_count <= 10:
                 quality_score += 1
-            elif len(text.split()) > 0:
+            elif word_count > 0:
                 quality_score += 0.5
             
             # Check for descriptive content (not just numbers or single words)
-            if len(text.split()) >= 2 and not text.isdigit():
+            if word_count >= 2 and not heading.is_digit:
                 quality_score += 0.5
         
         return min(1.0, quality_score / len(headings))
     
-    def _evaluate_semantic_elements(self, soup: BeautifulSoup) -> float:
+    def _evaluate_semantic_elements(self, scan: Dict) -> float:
         """Evaluate semantic HTML elements (max 25 points)"""
-        score = 0
-        
-        # Important semantic elements and their points
-        semantic_elements = {
-            'main': 5,      # Main content area
-            'article': 4,   # Article content
-            'section': 3,   # Content sections
-            'header': 2,    # Page/section headers
-            'footer': 2,    # Page/section footers
-            'nav': 2,       # Navigation
-            'aside': 1,     # Sidebar content
-            'figure': 1,    # Figures with captions
-            'figcaption': 1 # Figure captions
-        }
-        
-        found_elements = set()
-        
-        for element, points in semantic_elements.items():
-            if soup.find(element):
-                score += points
-                found_elements.add(element)
+        found_elements = scan['semantic']
+        score = sum(points for tag, points in _SEMANTIC_POINTS if tag in found_elements)
         
         # Bonus for using multiple semantic elements
-        if len(found_elements) >= 5:
-            score += 3
-        elif len(found_elements) >= 3:
-            score += 2
-        elif len(found_elements) >= 2:
-            score += 1
+        for min_found, bonus in _SEMANTIC_BONUS_THRESHOLDS:
+            if len(found_elements) >= min_found:
+                score += bonus
+                break
         
         return min(25, score)
     
-    def _evaluate_data_structures(self, soup: BeautifulSoup) -> float:
+    def _evaluate_data_structures(self, scan: Dict) -> float:
         """Evaluate lists and tables (max 25 points)"""
         score = 0
         
         # Check for lists
-        lists = soup.find_all(['ul', 'ol', 'dl'])
+        lists = scan['lists']
         if lists:
             score += 5
             
             # Bonus for using definition lists
-            if soup.find('dl'):
+            if scan['has_dl']:
                 score += 2
             
             # Check list quality
             quality_lists = 0
             for lst in lists:
-                items = lst.find_all(['li', 'dt', 'dd'])
+                items = _XP_LIST_ITEMS(lst)
                 if len(items) >= 2:  # At least 2 items
                     quality_lists += 1
             
@@ -192,65 +607,58 @@ class StructuredEvaluator:
                 score += min(5, quality_lists * 2)
         
         # Check for tables
-        tables = soup.find_all('table')
+        tables = scan['tables']
         if tables:
             score += 3
             
             # Check table quality
             for table in tables:
                 # Has table headers
-                if table.find('th') or table.find('thead'):
+                if table.find('.//th') is not None or table.find('.//thead') is not None:
                     score += 2
                 
                 # Has table caption
-                if table.find('caption'):
+                if table.find('.//caption') is not None:
                     score += 1
                 
                 # Has proper structure
-                if table.find('tbody') or table.find('thead'):
+                if table.find('.//tbody') is not None or table.find('.//thead') is not None:
                     score += 1
         
         # Check for other structured data elements
-        if soup.find_all(['blockquote', 'code', 'pre']):
+        if scan['has_quote_code']:
             score += 2
         
         return min(25, score)
     
-    def _evaluate_schema_markup(self, soup: BeautifulSoup) -> float:
+    def _evaluate_schema_markup(self, scan: Dict) -> float:
         """Evaluate schema.org markup (max 25 points)"""
         score = 0
         
         # Check for JSON-LD structured data
-        json_ld_scripts = soup.find_all('script', type='application/ld+json')
-        if json_ld_scripts:
+        if scan['json_ld']:
             score += 10
             
             # Bonus for multiple schemas
-            if len(json_ld_scripts) > 1:
+            if scan['json_ld'] > 1:
                 score += 2
         
         # Check for microdata
-        microdata_elements = soup.find_all(attrs={'itemscope': True})
-        if microdata_elements:
+        if scan['itemscope']:
             score += 5
             
             # Check for itemtype
-            typed_elements = soup.find_all(attrs={'itemtype': True})
-            if typed_elements:
+            if scan['itemtype']:
                 score += 3
         
         # Check for RDFa
-        rdfa_elements = soup.find_all(attrs={'typeof': True})
-        if rdfa_elements:
+        if scan['typeof']:
             score += 3
         
         # Check for meta properties (Open Graph, Twitter Cards)
-        og_tags = soup.find_all('meta', attrs={'property': re.compile(r'og:')})
-        twitter_tags = soup.find_all('meta', attrs={'name': re.compile(r'twitter:')})
-        
-        if og_tags:
+        if scan['open_graph']:
             score += 3
-        if twitter_tags:
+        if scan['twitter']:
             score += 2
         
         return min(25, score)
@@ -268,7 +676,7 @@ class StructuredEvaluator:
         else:
             return "Very Poor"
     
-    def get_detailed_analysis(self, html: str) -> Dict:
+    def get_detailed_analysis(self, html: HtmlInput) -> Dict:
         """Get detailed structure analysis"""
         if not html:
             return {
@@ -279,30 +687,35 @@ class StructuredEvaluator:
                 'elements_found': {}
             }
         
+        cache_key = self._result_key(html)
+        cached = self._cache_get(self._analysis_cache, cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
         try:
-            soup = BeautifulSoup(html, 'lxml')
+            scan = self._get_page(html)[1]
             
             # Calculate individual scores
-            heading_score = self._evaluate_headings(soup) if self.structured_config.get('check_headings', True) else 0
-            semantic_score = self._evaluate_semantic_elements(soup) if self.structured_config.get('check_semantic_elements', True) else 0
-            data_score = self._evaluate_data_structures(soup)
-            schema_score = self._evaluate_schema_markup(soup) if self.structured_config.get('check_schema_markup', True) else 0
+            heading_score = self._evaluate_headings(scan) if self.structured_config.get('check_headings', True) else 0
+            semantic_score = self._evaluate_semantic_elements(scan) if self.structured_config.get('check_semantic_elements', True) else 0
+            data_score = self._evaluate_data_structures(scan)
+            schema_score = self._evaluate_schema_markup(scan) if self.structured_config.get('check_schema_markup', True) else 0
             
             total_score = heading_score + semantic_score + data_score + schema_score
             rating = self._score_to_rating(total_score)
             
             # Find elements
-            elements_found = self._catalog_elements(soup)
+            elements_found = self._catalog_elements(scan)
             
             # Generate recommendations
-            recommendations = self._generate_recommendations(soup, {
+            recommendations = self._generate_recommendations(elements_found, {
                 'headings': heading_score,
                 'semantic': semantic_score,
                 'data': data_score,
                 'schema': schema_score
             })
             
-            return {
+            result = {
                 'rating': rating,
                 'total_score': round(total_score, 1),
                 'breakdown': {
@@ -314,6 +727,8 @@ class StructuredEvaluator:
                 'recommendations': recommendations,
                 'elements_found': elements_found
             }
+            self._cache_put(self._analysis_cache, cache_key, result)
+            return copy.deepcopy(result)
             
         except Exception as e:
             return {
@@ -324,84 +739,95 @@ class StructuredEvaluator:
                 'elements_found': {}
             }
     
-    def _catalog_elements(self, soup: BeautifulSoup) -> Dict:
+    def _catalog_elements(self, scan: Dict) -> Dict:
         """Catalog found structural elements"""
         elements = {
             'headings': {},
             'semantic': [],
-            'lists': 0,
-            'tables': 0,
-            'schema_types': []
+            'lists': len(scan['lists']),
+            'tables': len(scan['tables']),
+            'has_ul_ol': any(lst.tag != 'dl' for lst in scan['lists']),
+            'has_table_headers': scan['has_th'],
+            'schema_types': list(scan['itemtypes']),
+            'json_ld_scripts': scan['json_ld'],
+            'open_graph_tags': scan['open_graph']
         }
         
         # Catalog headings
-        for level in range(1, 7):
-            count = len(soup.find_all(f'h{level}'))
+        for level, level_headings in enumerate(scan['headings'], 1):
+            count = len(level_headings)
             if count > 0:
                 elements['headings'][f'h{level}'] = count
         
         # Catalog semantic elements
         semantic_tags = ['main', 'article', 'section', 'header', 'footer', 'nav', 'aside', 'figure']
-        for tag in semantic_tags:
-            if soup.find(tag):
-                elements['semantic'].append(tag)
+        elements['semantic'] = [tag for tag in semantic_tags if tag in scan['semantic']]
         
-        # Count lists and tables
-        elements['lists'] = len(soup.find_all(['ul', 'ol', 'dl']))
-        elements['tables'] = len(soup.find_all('table'))
-        
-        # Find schema types
-        schema_elements = soup.find_all(attrs={'itemtype': True})
-        for elem in schema_elements:
-            itemtype = elem.get('itemtype', '')
-            if itemtype:
-                elements['schema_types'].append(itemtype)
+        # Add the types declared in JSON-LD blocks
+        for script in scan['json_ld_scripts']:
+            elements['schema_types'].extend(self._json_ld_script_types(script.text or ''))
         
         return elements
     
-    def _generate_recommendations(self, soup: BeautifulSoup, scores: Dict) -> List[str]:
-        """Generate improvement recommendations"""
+    def _json_ld_script_types(self, body: str) -> Tuple[str, ...]:
+        """Parse a JSON-LD script body once per distinct body and return its @type values"""
+        key = self._page_key(body)
+        types = self._cache_get(self._json_ld_cache, key)
+        if types is not None:
+            return types
+        
+        try:
+            types = tuple(_json_ld_types(orjson.loads(body)))
+        except orjson.JSONDecodeError:
+            # Malformed or empty blocks declare nothing usable
+            types = ()
+        
+        self._cache_put(self._json_ld_cache, key, types)
+        return types
+    
+    def _generate_recommendations(self, elements_found: Dict, scores: Dict) -> List[str]:
+        """Generate improvement recommendations from the element catalog"""
         recommendations = []
         
         # Heading recommendations
         if scores['headings'] < 15:
-            h1_count = len(soup.find_all('h1'))
+            heading_counts = elements_found['headings']
+            h1_count = heading_counts.get('h1', 0)
             if h1_count == 0:
                 recommendations.append("Add a single H1 tag for the main page title")
             elif h1_count > 1:
                 recommendations.append("Use only one H1 tag per page")
             
-            if len(soup.find_all(['h2', 'h3', 'h4', 'h5', 'h6'])) == 0:
+            if not any(level != 'h1' for level in heading_counts):
                 recommendations.append("Add hierarchical headings (H2, H3, etc.) to structure content")
         
         # Semantic element recommendations
         if scores['semantic'] < 15:
-            if not soup.find('main'):
+            found_semantic = elements_found['semantic']
+            if 'main' not in found_semantic:
                 recommendations.append("Add a <main> element to identify the primary content area")
-            if not soup.find('article'):
+            if 'article' not in found_semantic:
                 recommendations.append("Use <article> elements for standalone content pieces")
-            if not soup.find('section'):
+            if 'section' not in found_semantic:
                 recommendations.append("Use <section> elements to group related content")
         
         # Data structure recommendations
         if scores['data'] < 15:
-            if not soup.find_all(['ul', 'ol']):
+            if not elements_found['has_ul_ol']:
                 recommendations.append("Use lists (<ul>, <ol>) to structure related items")
-            if soup.find_all('table') and not soup.find('th'):
+            if elements_found['tables'] and not elements_found['has_table_headers']:
                 recommendations.append("Add table headers (<th>) to improve table accessibility")
         
         # Schema recommendations
         if scores['schema'] < 15:
             recommendations.append("Add structured data markup (JSON-LD) to help search engines understand content")
-            if not soup.find_all('meta', attrs={'property': re.compile(r'og:')}):
+            if not elements_found['open_graph_tags']:
                 recommendations.append("Add Open Graph meta tags for better social media sharing")
         
         return recommendations
     
-    async def generate_enhanced_recommendations(self, html: str, rating: str) -> List[Dict]:
+    async def generate_enhanced_recommendations(self, html: HtmlInput, rating: str) -> List[Dict]:
         """Generate detailed, actionable recommendations for structural improvements"""
-        recommendations = []
-        
         if not html:
             return [{
                 "priority": "critical",
@@ -411,231 +837,159 @@ class StructuredEvaluator:
                 "action": "Provide valid HTML content for evaluation"
             }]
         
-        detailed_analysis = self.get_detailed_analysis(html)
+        return self.generate_enhanced_recommendations_from_analysis(self.get_detailed_analysis(html), rating)
+    
+    def generate_enhanced_recommendations_from_analysis(self, detailed_analysis: Dict, rating: str) -> List[Dict]:
+        """
+        Generate structural recommendations from an existing detailed analysis
+        
+        Args:
+            detailed_analysis: Result of get_detailed_analysis for the page
+            rating: Structure rating of the page
+            
+        Returns:
+            List of recommendation dicts
+        """
+        recommendations = []
+        
         scores = detailed_analysis.get('breakdown', {})
         elements_found = detailed_analysis.get('elements_found', {})
         
         # Critical issues (Very Poor, Poor ratings)
         if rating in ["Very Poor", "Poor"]:
-            recommendations.append({
-                "priority": "critical",
-                "category": "structural_foundation",
-                "issue": f"HTML structure rated as {rating} - fundamental structural issues",
-                "impact": "10% weight metric - poor LLM understanding and SEO impact",
-                "action": "Implement comprehensive structural improvements",
-                "specifics": {
+            recommendations.append(_from_template(
+                _REC_STRUCTURAL_FOUNDATION,
+                issue=f"HTML structure rated as {rating} - fundamental structural issues",
+                specifics={
                     "current_rating": rating,
                     "total_score": detailed_analysis.get('total_score', 0),
                     "max_possible": 100,
                     "improvement_needed": f"{100 - detailed_analysis.get('total_score', 0):.0f} points"
-                },
-                "implementation": {
-                    "effort": "high",
-                    "timeline": "1-2 weeks",
-                    "phases": [
-                        "Phase 1: Fix heading structure (Week 1)",
-                        "Phase 2: Add semantic elements (Week 1-2)",
-                        "Phase 3: Implement schema markup (Week 2)"
-                    ]
                 }
-            })
+            ))
         
         # Heading structure issues
         heading_score = scores.get('headings', {}).get('score', 0)
         if heading_score < 15:
-            soup = BeautifulSoup(html, 'lxml')
-            h1_count = len(soup.find_all('h1'))
-            total_headings = len(soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']))
+            heading_counts = elements_found.get('headings', {})
+            h1_count = heading_counts.get('h1', 0)
+            total_headings = sum(heading_counts.values())
             
             priority = "critical" if heading_score < 5 else "high"
-            recommendations.append({
-                "priority": priority,
-                "category": "heading_structure",
-                "issue": f"Poor heading structure (score: {heading_score}/25)",
-                "impact": "Reduced content hierarchy understanding for both users and LLMs",
-                "action": "Implement proper heading hierarchy",
-                "specifics": {
+            recommendations.append(_from_template(
+                _REC_HEADING_STRUCTURE,
+                priority=priority,
+                issue=f"Poor heading structure (score: {heading_score}/25)",
+                specifics={
                     "h1_count": h1_count,
                     "total_headings": total_headings,
                     "current_score": heading_score,
                     "target_score": "20+",
                     "heading_distribution": elements_found.get('headings', {})
                 },
-                "implementation": {
+                implementation={
                     "effort": "low",
                     "timeline": "1-2 days",
                     "steps": [
                         "Add exactly one H1 tag for the main page title" if h1_count != 1 else "Maintain single H1 structure",
-                        "Create logical heading hierarchy (H1 → H2 → H3)",
-                        "Ensure headings describe content sections clearly",
-                        "Use 3-10 words per heading for optimal length",
-                        "Avoid skipping heading levels (e.g., H1 directly to H3)"
+                        *_HEADING_STEPS
                     ],
                     "specific_fixes": [
                         f"Current H1 count: {h1_count} (should be 1)",
-                        f"Add {max(0, 3 - len(soup.find_all(['h2', 'h3'])))} more subheadings",
+                        f"Add {max(0, 3 - heading_counts.get('h2', 0) - heading_counts.get('h3', 0))} more subheadings",
                         "Review heading content for descriptiveness"
                     ]
                 }
-            })
+            ))
         
         # Semantic elements issues
         semantic_score = scores.get('semantic_elements', {}).get('score', 0)
         if semantic_score < 15:
-            soup = BeautifulSoup(html, 'lxml')
+            found_semantic = elements_found.get('semantic', [])
             missing_elements = []
             critical_missing = []
             
-            if not soup.find('main'):
+            if 'main' not in found_semantic:
                 critical_missing.append('main')
-            if not soup.find('header'):
+            if 'header' not in found_semantic:
                 missing_elements.append('header')
-            if not soup.find('nav'):
+            if 'nav' not in found_semantic:
                 missing_elements.append('nav')
-            if not soup.find('article'):
+            if 'article' not in found_semantic:
                 missing_elements.append('article')
-            if not soup.find('section'):
+            if 'section' not in found_semantic:
                 missing_elements.append('section')
             
-            recommendations.append({
-                "priority": "high" if critical_missing else "medium",
-                "category": "semantic_markup",
-                "issue": f"Insufficient semantic HTML elements (score: {semantic_score}/25)",
-                "impact": "Poor content structure recognition by search engines and screen readers",
-                "action": "Add semantic HTML5 elements to improve content structure",
-                "specifics": {
+            recommendations.append(_from_template(
+                _REC_SEMANTIC_MARKUP,
+                priority="high" if critical_missing else "medium",
+                issue=f"Insufficient semantic HTML elements (score: {semantic_score}/25)",
+                specifics={
                     "current_score": semantic_score,
                     "target_score": "20+",
                     "critical_missing": critical_missing,
                     "missing_elements": missing_elements,
                     "found_elements": elements_found.get('semantic', [])
-                },
-                "implementation": {
-                    "effort": "medium",
-                    "timeline": "2-3 days",
-                    "priority_order": [
-                        "<main> - Wrap primary content (highest priority)",
-                        "<header> - Page/section headers",
-                        "<nav> - Navigation areas",
-                        "<article> - Standalone content pieces",
-                        "<section> - Thematic content groups",
-                        "<aside> - Sidebar/supplementary content",
-                        "<footer> - Page/section footers"
-                    ],
-                    "implementation_guide": {
-                        "main": "Wrap the primary content area with <main>",
-                        "header": "Use for page header, logo, and primary navigation",
-                        "nav": "Wrap navigation menus and breadcrumbs",
-                        "article": "Use for blog posts, news articles, or standalone content",
-                        "section": "Group related content with thematic headings"
-                    }
                 }
-            })
+            ))
         
         # Data structures issues
         data_score = scores.get('data_structures', {}).get('score', 0)
         if data_score < 15:
-            soup = BeautifulSoup(html, 'lxml')
-            has_lists = len(soup.find_all(['ul', 'ol', 'dl'])) > 0
-            has_tables = len(soup.find_all('table')) > 0
+            has_lists = elements_found.get('lists', 0) > 0
+            has_tables = elements_found.get('tables', 0) > 0
             
-            recommendations.append({
-                "priority": "medium",
-                "category": "data_organization",
-                "issue": f"Poor data structure organization (score: {data_score}/25)",
-                "impact": "Missed opportunities for better content organization and comprehension",
-                "action": "Implement appropriate data structures for content organization",
-                "specifics": {
+            recommendations.append(_from_template(
+                _REC_DATA_ORGANIZATION,
+                issue=f"Poor data structure organization (score: {data_score}/25)",
+                specifics={
                     "current_score": data_score,
                     "target_score": "18+",
                     "has_lists": has_lists,
                     "has_tables": has_tables,
                     "list_count": elements_found.get('lists', 0),
                     "table_count": elements_found.get('tables', 0)
-                },
-                "implementation": {
-                    "effort": "low",
-                    "timeline": "1-2 days",
-                    "opportunities": [
-                        "Convert related items to bulleted lists (<ul>)",
-                        "Use numbered lists (<ol>) for sequential steps",
-                        "Implement tables for comparative data",
-                        "Add table headers (<th>) for accessibility",
-                        "Use definition lists (<dl>) for term-definition pairs"
-                    ],
-                    "specific_actions": [
-                        "Identify content that would benefit from list structure",
-                        "Add table captions for better accessibility",
-                        "Ensure tables have proper header structure",
-                        "Consider using <blockquote> for quotations"
-                    ]
                 }
-            })
+            ))
         
         # Schema markup issues
         schema_score = scores.get('schema_markup', {}).get('score', 0)
         if schema_score < 15:
-            soup = BeautifulSoup(html, 'lxml')
-            has_json_ld = len(soup.find_all('script', type='application/ld+json')) > 0
-            has_og_tags = len(soup.find_all('meta', attrs={'property': re.compile(r'og:')})) > 0
+            has_json_ld = elements_found.get('json_ld_scripts', 0) > 0
+            has_og_tags = elements_found.get('open_graph_tags', 0) > 0
             
             priority = "high" if schema_score < 5 else "medium"
-            recommendations.append({
-                "priority": priority,
-                "category": "structured_data",
-                "issue": f"Missing or insufficient structured data markup (score: {schema_score}/25)",
-                "impact": "Poor search engine understanding and reduced rich snippet opportunities",
-                "action": "Implement comprehensive structured data markup",
-                "specifics": {
+            recommendations.append(_from_template(
+                _REC_STRUCTURED_DATA,
+                priority=priority,
+                issue=f"Missing or insufficient structured data markup (score: {schema_score}/25)",
+                specifics={
                     "current_score": schema_score,
                     "target_score": "18+",
                     "has_json_ld": has_json_ld,
                     "has_open_graph": has_og_tags,
                     "schema_types_found": elements_found.get('schema_types', [])
-                },
-                "implementation": {
-                    "effort": "medium",
-                    "timeline": "3-5 days",
-                    "priority_implementations": [
-                        "JSON-LD structured data (highest impact)",
-                        "Open Graph meta tags for social sharing",
-                        "Twitter Card meta tags",
-                        "Basic microdata markup"
-                    ],
-                    "schema_types_to_implement": [
-                        "Organization - Company/business information",
-                        "Website - Website metadata",
-                        "Article - Content pieces",
-                        "BreadcrumbList - Navigation hierarchy",
-                        "ContactPoint - Contact information"
-                    ],
-                    "code_examples": {
-                        "basic_organization": "Add JSON-LD script with Organization schema",
-                        "open_graph": "Add og:title, og:description, og:image meta tags",
-                        "twitter_cards": "Add twitter:card, twitter:title meta tags"
-                    }
                 }
-            })
+            ))
         
         # Optimization recommendations for good structures
         if rating in ["Good", "Excellent"]:
-            recommendations.append({
-                "priority": "low",
-                "category": "structural_optimization",
-                "issue": "Good structural foundation with optimization opportunities",
-                "impact": "Fine-tuning can improve LLM understanding and user experience",
-                "action": "Optimize existing structure for maximum effectiveness",
-                "implementation": {
-                    "effort": "low",
-                    "timeline": "1-2 days",
-                    "optimizations": [
-                        "Review heading hierarchy for logical flow",
-                        "Add missing alt attributes to images",
-                        "Ensure all forms have proper labels",
-                        "Add ARIA landmarks where beneficial",
-                        "Validate HTML for any syntax errors"
-                    ]
-                }
-            })
+            recommendations.append(_from_template(_REC_STRUCTURAL_OPTIMIZATION))
         
-        return recommendations
\ No newline at end of file
+        return recommendations
+
+
+# Per-process evaluator used by StructuredEvaluator.evaluate_batch workers
+_batch_worker_evaluator: Optional[StructuredEvaluator] = None
+
+
+def _init_batch_worker(config, structured_config: Dict) -> None:
+    """Create the worker process's evaluator with the parent's structure checks"""
+    global _batch_worker_evaluator
+    _batch_worker_evaluator = StructuredEvaluator(config)
+    _batch_worker_evaluator.structured_config = structured_config
+
+
+def _evaluate_in_batch_worker(html: Union[str, bytes]) -> str:
+    """Rate one page in a batch worker process"""
+    return _batch_worker_evaluator.evaluate(html)
@@ -2,19 +2,37 @@
 Configuration management for GRASP evaluator
 """
 
+import copy
 import os
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 
+# LibYAML's C loader and dumper are much faster when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+
+# Parsed config files keyed by (absolute path, modification time), so repeated
+# ConfigManager construction skips the YAML parse until the file changes
+_CONFIG_CACHE: Dict[Tuple[str, int], Dict] = {}
+
+# The .env file only needs reading once per process
+_DOTENV_LOADED = False
+
 
 class ConfigManager:
     """Manages configuration for GRASP evaluator"""
     
     def __init__(self, config_path: Optional[str] = None):
         # Load environment variables
-        load_dotenv()
+        global _DOTENV_LOADED
+        if not _DOTENV_LOADED:
+            load_dotenv()
+            _DOTENV_LOADED = True
         
         self.config_path = config_path or self._get_default_config_path()
         self.config = self._load_config()
@@ -27,9 +45,19 @@ class ConfigManager:
     def _load_config(self) -> Dict:
         """Load configuration from YAML file"""
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            return config
+            config_path = os.path.abspath(self.config_path)
+            key = (config_path, os.stat(config_path).st_mtime_ns)
+            if key not in _CONFIG_CACHE:
+                with open(config_path, 'r') as f:
+                    config = yaml.load(f, Loader=_YamlLoader)
+                
+                # Drop entries for earlier versions of the same file
+                for stale_key in [k for k in _CONFIG_CACHE if k[0] == config_path]:
+                    del _CONFIG_CACHE[stale_key]
+                _CONFIG_CACHE[key] = config
+            
+            # Callers adjust their config in place, so each instance gets its own copy
+            return copy.deepcopy(_CONFIG_CACHE[key])
         except FileNotFoundError:
             # Return default configuration
             return self._get_default_config()
@@ -82,6 +110,10 @@ class ConfigManager:
         """Get customer intents for grounded evaluation"""
         return self.config.get('grounded', {}).get('intents', [])
     
+    def get_grounded_config(self) -> Dict:
+        """Get grounded evaluation configuration"""
+        return self.config.get('grounded', {})
+    
     def get_target_audience(self) -> str:
         """Get target audience for readable evaluation"""
         return self.config.get('readable', {}).get('target_audience', 'general_public')
@@ -115,6 +147,10 @@ class ConfigManager:
         targets = self.config.get('targets', [])
         return [target.get('url') for target in targets if target.get('url')]
     
+    def get_api_config(self) -> Dict:
+        """Get API request configuration (timeouts, retries)"""
+        return self.config.get('api', {})
+    
     def get_openai_api_key(self) -> str:
         """Get OpenAI API key from environment"""
         api_key = os.getenv('OPENAI_API_KEY')
@@ -130,4 +166,4 @@ class ConfigManager:
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
         with open(output_path, 'w') as f:
-            yaml.dump(self.config, f, default_flow_style=False, indent=2)
\ No newline at end of file
+            yaml.dump(self.config, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
\ No newline at end of file
@@ -25,8 +25,9 @@ from utils.scoring import ScoringEngine
 class GRASPEvaluator:
     """Main GRASP evaluation orchestrator"""
     
-    def __init__(self, config_path: Optional[str] = None):
-        self.config = ConfigManager(config_path)
+    def __init__(self, config_path: Optional[str] = None, config: Optional[ConfigManager] = None):
+        # Reuse a caller's already-loaded configuration instead of loading it again
+        self.config = config if config is not None else ConfigManager(config_path)
         self.logger = logging.getLogger(__name__)
         
         # Initialize evaluators
@@ -100,6 +101,11 @@ class GRASPEvaluator:
             self.logger.error(f"Error evaluating website {url}: {e}")
             raise
     
+    async def aclose(self):
+        """Release pooled API connections held by the evaluators"""
+        await self.grounded_evaluator.aclose()
+        await self.polished_evaluator.aclose()
+    
     async def _fetch_content(self, url: str) -> Tuple[str, str]:
         """Fetch and extract content from URL"""
         try:
@@ -218,7 +224,9 @@ class GRASPEvaluator:
         # Collect enhanced recommendations from each metric evaluator
         try:
             # Grounded recommendations
-            grounded_detailed = await self.grounded_evaluator.get_detailed_analysis(text_content, self.config.get_intents())
+            grounded_detailed = await self.grounded_evaluator.get_detailed_analysis(
+                text_content, self.config.get_intents(), with_recommendations=False
+            )
             grounded_recs = await self.grounded_evaluator._generate_enhanced_recommendations(
                 grounded_detailed.get('intent_scores', []),
                 metrics['grounded'],
@@ -231,7 +239,7 @@ class GRASPEvaluator:
         try:
             # Readable recommendations
             target_level = self.config.get_target_audience()
-            readable_recs = await self.readable_evaluator.generate_enhanced_recommendations(
+            readable_recs = self.readable_evaluator.generate_enhanced_recommendations(
                 text_content, target_level, metrics['readable']
             )
             all_recommendations.extend(readable_recs)
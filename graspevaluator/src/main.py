@@ -39,18 +39,22 @@ def setup_logging(config: ConfigManager):
         logging.getLogger().addHandler(file_handler)
 
 
-async def run_evaluation(url: str, config_path: str = None, output_dir: str = None) -> dict:
-    """Run GRASP evaluation for a single URL"""
+async def run_evaluation(url: str, config_path: str = None, output_dir: str = None,
+                         config: ConfigManager = None) -> dict:
+    """Run GRASP evaluation for a single URL, reusing config when it is already loaded"""
     logger = logging.getLogger(__name__)
     
     try:
         # Initialize evaluator
-        evaluator = GRASPEvaluator(config_path)
+        evaluator = GRASPEvaluator(config_path, config=config)
         
         logger.info(f"Starting GRASP evaluation for: {url}")
         
         # Run evaluation
-        results = await evaluator.evaluate_website(url)
+        try:
+            results = await evaluator.evaluate_website(url)
+        finally:
+            await evaluator.aclose()
         
         # Save results
         saved_path = evaluator.save_results(results, output_dir)
@@ -64,13 +68,15 @@ async def run_evaluation(url: str, config_path: str = None, output_dir: str = No
         raise
 
 
-async def run_batch_evaluation(config_path: str = None, output_dir: str = None) -> list:
-    """Run GRASP evaluation for all URLs in configuration"""
+async def run_batch_evaluation(config_path: str = None, output_dir: str = None,
+                               config: ConfigManager = None) -> list:
+    """Run GRASP evaluation for all URLs in configuration, reusing config when it is already loaded"""
     logger = logging.getLogger(__name__)
     
     try:
-        # Load configuration
-        config = ConfigManager(config_path)
+        # Load configuration once and share it with the evaluator
+        if config is None:
+            config = ConfigManager(config_path)
         target_urls = config.get_target_urls()
         
         if not target_urls:
@@ -81,22 +87,25 @@ async def run_batch_evaluation(config_path: str = None, output_dir: str = None)
         
         # Run evaluations
         all_results = []
-        evaluator = GRASPEvaluator(config_path)
-        
-        for url in target_urls:
-            try:
-                logger.info(f"Evaluating: {url}")
-                results = await evaluator.evaluate_website(url)
-                
-                # Save individual results
-                saved_path = evaluator.save_results(results, output_dir)
-                logger.info(f"Results for {url} saved to: {saved_path}")
-                
-                all_results.append(results)
-                
-            except Exception as e:
-                logger.error(f"Error evaluating {url}: {e}")
-                continue
+        evaluator = GRASPEvaluator(config=config)
+        
+        try:
+            for url in target_urls:
+                try:
+                    logger.info(f"Evaluating: {url}")
+                    results = await evaluator.evaluate_website(url)
+                    
+                    # Save individual results
+                    saved_path = evaluator.save_results(results, output_dir)
+                    logger.info(f"Results for {url} saved to: {saved_path}")
+                    
+                    all_results.append(results)
+                    
+                except Exception as e:
+                    logger.error(f"Error evaluating {url}: {e}")
+                    continue
+        finally:
+            await evaluator.aclose()
         
         logger.info(f"Batch evaluation completed. {len(all_results)} URLs processed successfully.")
         
@@ -207,11 +216,11 @@ def main():
         # Run evaluation - automatically determine mode based on whether URL is provided
         if args.url:
             # Single URL evaluation
-            results = asyncio.run(run_evaluation(args.url, args.config, args.output))
+            results = asyncio.run(run_evaluation(args.url, args.config, args.output, config=config))
             print_results_summary(results)
         else:
             # Batch evaluation (default when no URL provided)
-            results_list = asyncio.run(run_batch_evaluation(args.config, args.output))
+            results_list = asyncio.run(run_batch_evaluation(args.config, args.output, config=config))
             
             if results_list:
                 print(f"\nBatch evaluation completed successfully!")
@@ -0,0 +1,40 @@
+"""
+Shared fixtures for GRASP evaluator tests
+"""
+
+import itertools
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Mirror graspevaluator.py: metrics/utils import from the package root, the
+# engine modules from src/
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+
+@pytest.fixture
+def make_config(tmp_path, monkeypatch):
+    """Build a ConfigManager from a config dict, with LLM use disabled by default"""
+    pytest.importorskip("dotenv")
+    from config_manager import ConfigManager
+    
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+    
+    # One file per call: ConfigManager caches parsed files by path and mtime
+    file_numbers = itertools.count()
+    
+    def _make_config(overrides=None):
+        config = {
+            'grounded': {'intents': ["How do I contact Airbais?"]},
+            'polished': {'use_llm': False},
+        }
+        config.update(overrides or {})
+        config_path = tmp_path / f"grasp_config_{next(file_numbers)}.yaml"
+        config_path.write_text(yaml.safe_dump(config))
+        return ConfigManager(str(config_path))
+    
+    return _make_config
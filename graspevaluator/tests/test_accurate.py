@@ -0,0 +1,60 @@
+"""
+Tests for the accurate metric
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("bs4")
+
+from metrics.accurate import AccurateEvaluator
+
+
+@pytest.fixture
+def evaluator(make_config):
+    return AccurateEvaluator(make_config())
+
+
+def test_http_session_is_per_thread(evaluator):
+    assert evaluator._http is evaluator._http
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        worker_session = executor.submit(lambda: evaluator._http).result()
+    assert worker_session is not evaluator._http
+
+
+HIDDEN_TIME_PAGE = (
+    '<html><body><p>Updated: January 5, 2021</p>'
+    '<!-- <time datetime="2099-01-01"></time> -->'
+    '<script>var badge = "<time datetime=\'2024-09-01\'>new</time>";</script>'
+    '</body></html>'
+)
+
+
+def test_time_markup_in_comments_and_scripts_is_ignored(evaluator):
+    assert evaluator._check_time_elements(HIDDEN_TIME_PAGE) is None
+    
+    analysis = evaluator.get_detailed_analysis(HIDDEN_TIME_PAGE, "https://example.com")
+    assert analysis['last_modified'] == "2021-01-05T00:00:00"
+    assert analysis['sources_found'] == ['content_patterns']
+    assert analysis['rating'] == 'Low'
+    assert evaluator.evaluate(HIDDEN_TIME_PAGE, "https://example.com") == 'Low'
+
+
+def test_time_elements_use_latest_datetime_and_text(evaluator):
+    html = (
+        '<p><time datetime="2020-01-01">New Year</time>'
+        '<time>  March 3, 2020 </time><!-- <time>May 1, 2030</time> --></p>'
+    )
+    assert evaluator._check_time_elements(html).date().isoformat() == "2020-03-03"
+
+
+def test_meta_tags_in_priority_order(evaluator):
+    html = (
+        '<head><meta name="pubdate" content="2019-04-01">'
+        '<!-- <meta name="last-modified" content="2099-01-01"> -->'
+        '<meta property="article:modified_time" content="2021-06-15T08:30:00"></head>'
+    )
+    assert evaluator._check_meta_tags(html).isoformat() == "2021-06-15T08:30:00"
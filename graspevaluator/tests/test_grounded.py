@@ -0,0 +1,35 @@
+"""
+Tests for the grounded metric's result cache
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("openai")
+
+from metrics.grounded import GroundedEvaluator
+
+
+@pytest.fixture
+def evaluator(make_config, monkeypatch):
+    # Cache hits never reach the API, so any key will do
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    evaluator = GroundedEvaluator(make_config())
+    yield evaluator
+    asyncio.run(evaluator.aclose())
+
+
+def test_cached_answers_are_not_shared_with_callers(evaluator):
+    content, intent = "Email hello@example.com to reach us.", "How do I contact Airbais?"
+    answer = {'answer': "By email", 'gaps': ["phone number"], 'citations': ["Email hello@example.com"]}
+    cache_key = evaluator._cache_key("analysis", evaluator.model, intent, content)
+    evaluator._cache_put(cache_key, (answer, 8.0))
+    
+    first, _ = asyncio.run(evaluator._answer_and_score(content, intent))
+    first['gaps'].append("office address")
+    first['citations'].clear()
+    
+    second, score = asyncio.run(evaluator._answer_and_score(content, intent))
+    assert second == answer
+    assert score == 8.0
@@ -0,0 +1,91 @@
+"""
+Tests for the polished metric
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("openai")
+
+from metrics.polished import PolishedEvaluator
+
+
+@pytest.fixture
+def evaluator(make_config):
+    return PolishedEvaluator(make_config())
+
+
+@pytest.mark.parametrize("content, expected", [
+    ("It is to much-fun.", 1),
+    ("you could of-course", 1),
+    ("alot-of", 1),
+    ("x alot's", 1),
+    ("(to much) and would of", 2),
+    ("x-to much", 1),
+    ("to-much its' going", 0),
+    ("Your welcome, there going alot", 3),
+])
+def test_grammar_mistakes_match_word_boundary_regexes(evaluator, content, expected):
+    # Hyphens and apostrophes end a word just like the old \b-delimited patterns
+    assert evaluator._check_common_grammar_mistakes(content) == expected
+
+
+DOCUMENTS = [
+    "",
+    "This is a short and clean sentence.",
+    "teh recieve of the the document occured yesterday , and its going alot to much.",
+    "Another clean sentence for the batch.",
+    "we could of done better.the spacing  is off!!",
+]
+
+
+def test_evaluate_batch_matches_evaluate(evaluator):
+    batch_ratings = asyncio.run(evaluator.evaluate_batch(DOCUMENTS))
+    assert batch_ratings == [asyncio.run(evaluator.evaluate(content)) for content in DOCUMENTS]
+
+
+def test_batch_api_only_receives_documents_evaluate_would_check(evaluator, monkeypatch, caplog):
+    submitted = []
+    
+    async def fake_batch_api(contents):
+        submitted.extend(contents)
+        raise RuntimeError("batch expired")
+    
+    evaluator.use_llm = True
+    evaluator.openai_client = object()
+    monkeypatch.setattr(evaluator, 'BATCH_API_MIN_DOCUMENTS', 2)
+    monkeypatch.setattr(evaluator, '_evaluate_with_batch_api', fake_batch_api)
+    # Per-document fallback after the failed job: score with the rules, not the API
+    monkeypatch.setattr(evaluator, '_llm_grammar_check',
+                        lambda content, words: asyncio.sleep(0, (evaluator._rule_based_grammar_check(content, words), True)))
+    
+    cached_rating = asyncio.run(evaluator.evaluate(DOCUMENTS[4]))
+    ratings = asyncio.run(evaluator.evaluate_batch(DOCUMENTS + [DOCUMENTS[2] + " Extra words."]))
+    
+    # Empty, obviously clean and cached documents never reach the Batch API
+    assert submitted == [DOCUMENTS[2], DOCUMENTS[2] + " Extra words."]
+    assert ratings[:2] == ["Very Poor", "Excellent"]
+    assert ratings[3] == "Excellent"
+    assert ratings[4] == cached_rating
+    assert "Batch API job for 2 documents failed" in caplog.text
+
+
+@pytest.mark.parametrize("content", [
+    "This is a short and clean sentence.",
+    "Another clean sentence for the batch. It has two parts.",
+])
+def test_detailed_analysis_agrees_with_evaluate_on_fast_path(evaluator, monkeypatch, content):
+    async def harsh_llm(content, words=None, with_issues=True):
+        return 0.5, ["LLM issue"], True
+    
+    evaluator.use_llm = True
+    evaluator.openai_client = object()
+    monkeypatch.setattr(evaluator, '_llm_full_analysis', harsh_llm)
+    
+    rating = asyncio.run(evaluator.evaluate(content))
+    analysis = asyncio.run(evaluator.get_detailed_analysis(content))
+    
+    assert rating == analysis['rating'] == "Excellent"
+    assert analysis['issues_found'] == []
+    assert analysis['word_count'] == len(content.split())
@@ -0,0 +1,42 @@
+"""
+Tests for the readable metric's recommendations
+"""
+
+import pytest
+
+from metrics.readable import ReadableEvaluator
+
+
+@pytest.fixture
+def evaluator(make_config):
+    return ReadableEvaluator(make_config())
+
+
+def _implementation_values(recommendations):
+    return [
+        values
+        for recommendation in recommendations
+        for values in recommendation.get('implementation', {}).values()
+        if isinstance(values, list)
+    ]
+
+
+@pytest.mark.parametrize("is_appropriate, scores", [
+    # Appropriate content gets the optimization template
+    (True, {'average_grade_level': 9.0, 'flesch_reading_ease': 65.0, 'word_count': 300, 'sentence_count': 20}),
+    # Hard content with long sentences gets the sentence structure and length templates
+    (False, {'average_grade_level': 18.0, 'flesch_reading_ease': 20.0, 'word_count': 600, 'sentence_count': 12}),
+])
+def test_recommendations_do_not_share_nested_values(evaluator, is_appropriate, scores):
+    first = evaluator.generate_enhanced_recommendations("", 'general_public', is_appropriate, scores)
+    for recommendation in first:
+        recommendation.get('implementation', {})['target'] = "mutated by caller"
+    for values in _implementation_values(first):
+        values.append("mutated by caller")
+    
+    second = evaluator.generate_enhanced_recommendations("", 'general_public', is_appropriate, scores)
+    assert second
+    for recommendation in second:
+        assert recommendation.get('implementation', {}).get('target') != "mutated by caller"
+    for values in _implementation_values(second):
+        assert "mutated by caller" not in values
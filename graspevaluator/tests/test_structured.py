@@ -0,0 +1,155 @@
+"""
+Tests for the structured metric
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("lxml")
+
+from metrics.structured import StructuredEvaluator
+
+
+# Sample pages covering each scoring category
+SAMPLE_PAGES = {
+    'complete': (
+        '<html><head><meta property="og:title" content="Airbais">'
+        '<meta name="twitter:card" content="summary">'
+        '<script type="application/ld+json">{"@type": "Organization", "name": "Airbais"}</script></head>'
+        '<body><header><nav><ul><li>Home</li><li>Tools</li></ul></nav></header>'
+        '<main><article><h1>Evaluate your content for generative search</h1>'
+        '<section><h2>How the GRASP metrics work</h2><p>Five dimensions.</p>'
+        '<ol><li>Grounded</li><li>Readable</li></ol>'
+        '<table><tr><th>Metric</th></tr><tr><td>Polished</td></tr></table></section>'
+        '<section><h2>Getting started with the tools</h2><h3>Install the evaluator locally</h3>'
+        '<figure><pre><code>pip install</code></pre><figcaption>Install</figcaption></figure>'
+        '<blockquote>Quote</blockquote></section></article>'
+        '<aside>Related</aside></main><footer>Contact</footer></body></html>'
+    ),
+    'headings_only': (
+        '<html><body><h1>Welcome to the site</h1><h3>Skipped a level here</h3>'
+        '<h2>Back to a second level heading</h2><h2>1</h2><h4>Deep</h4></body></html>'
+    ),
+    'multiple_h1_microdata': (
+        '<html><body><h1>First title on the page</h1><h1>Second title on the page</h1>'
+        '<div itemscope itemtype="https://schema.org/Person"><span itemprop="name">Ada</span></div>'
+        '<div typeof="Product">Widget</div><section><p>Text</p></section>'
+        '<dl><dt>Term</dt><dd>Definition</dd></dl></body></html>'
+    ),
+    'tables_without_headers': (
+        '<html><head><meta name="twitter:title" content="T"></head><body><div>'
+        '<table><tr><td>a</td><td>b</td></tr></table><table><tr><td>c</td></tr></table>'
+        '<p>Plain paragraph text without any structure at all.</p></div></body></html>'
+    ),
+    'script_in_heading': (
+        '<html><body><main><h1><script>var x = 1;</script>Heading with script</h1>'
+        '<h2><!-- note -->Comment inside heading text</h2><h2>   </h2>'
+        '<ul><li>One</li></ul><ul><li>Two</li><li>Three</li></ul></main></body></html>'
+    ),
+    'bare_text': '<p>Just a paragraph.</p>',
+}
+
+# What the original BeautifulSoup implementation produced for each sample page: (rating,
+# total score, category scores, recommendation count, enhanced recommendation categories)
+BASELINE_RESULTS = {
+    'complete': ('Good', 80, (25, 24, 16, 15), 0, ['structural_optimization']),
+    'headings_only': ('Poor', 25, (25, 0, 0, 0), 6,
+                      ['structural_foundation', 'semantic_markup', 'data_organization', 'structured_data']),
+    'multiple_h1_microdata': ('Poor', 45.0, (22.0, 3, 9, 11), 5,
+                              ['structural_foundation', 'semantic_markup', 'data_organization', 'structured_data']),
+    'tables_without_headers': ('Very Poor', 5, (0, 0, 3, 2), 9,
+                               ['structural_foundation', 'heading_structure', 'semantic_markup',
+                                'data_organization', 'structured_data']),
+    'script_in_heading': ('Poor', 37, (25, 5, 7, 0), 4,
+                          ['structural_foundation', 'semantic_markup', 'data_organization', 'structured_data']),
+    'bare_text': ('Very Poor', 0, (0, 0, 0, 0), 8,
+                  ['structural_foundation', 'heading_structure', 'semantic_markup',
+                   'data_organization', 'structured_data']),
+}
+
+
+@pytest.fixture
+def evaluator(make_config):
+    return StructuredEvaluator(make_config())
+
+
+def _weak_page_analysis():
+    """Detailed analysis of a page that triggers every improvement recommendation"""
+    return {
+        'total_score': 12,
+        'breakdown': {
+            'headings': {'score': 3},
+            'semantic_elements': {'score': 2},
+            'data_structures': {'score': 4},
+            'schema_markup': {'score': 3},
+        },
+        'elements_found': {'headings': {'h1': 0}, 'semantic': [], 'lists': 0, 'tables': 0},
+    }
+
+
+@pytest.mark.parametrize("rating", ["Poor", "Good"])
+def test_recommendations_do_not_share_nested_values(evaluator, rating):
+    first = evaluator.generate_enhanced_recommendations_from_analysis(_weak_page_analysis(), rating)
+    for recommendation in first:
+        for values in recommendation.get('implementation', {}).values():
+            if isinstance(values, list):
+                values.append("mutated by caller")
+            elif isinstance(values, dict):
+                values.clear()
+    
+    second = evaluator.generate_enhanced_recommendations_from_analysis(_weak_page_analysis(), rating)
+    assert second
+    for recommendation in second:
+        for values in recommendation.get('implementation', {}).values():
+            assert values and "mutated by caller" not in values
+
+
+@pytest.mark.parametrize("name", sorted(SAMPLE_PAGES))
+def test_sample_pages_match_baseline(evaluator, name):
+    rating, total_score, category_scores, recommendation_count, categories = BASELINE_RESULTS[name]
+    html = SAMPLE_PAGES[name]
+    
+    analysis = evaluator.get_detailed_analysis(html)
+    breakdown = analysis['breakdown']
+    assert evaluator.evaluate(html) == rating
+    assert analysis['rating'] == rating
+    assert analysis['total_score'] == total_score
+    assert tuple(breakdown[category]['score'] for category in
+                 ('headings', 'semantic_elements', 'data_structures', 'schema_markup')) == category_scores
+    assert len(analysis['recommendations']) == recommendation_count
+    
+    recommendations = asyncio.run(evaluator.generate_enhanced_recommendations(html, rating))
+    assert [recommendation['category'] for recommendation in recommendations] == categories
+
+
+def _batch_pages(count):
+    """Distinct pages cycling through the samples as str, bytes and memoryview input"""
+    pages = []
+    for index in range(count):
+        html = SAMPLE_PAGES[sorted(SAMPLE_PAGES)[index % len(SAMPLE_PAGES)]] + f"<!-- page {index} -->"
+        kind = index % 3
+        pages.append(html if kind == 0 else html.encode() if kind == 1 else memoryview(html.encode()))
+    return pages
+
+
+def test_evaluate_batch_matches_evaluate(make_config):
+    pages = _batch_pages(StructuredEvaluator.BATCH_PARALLEL_MIN_PAGES + 7)
+    
+    batch_ratings = StructuredEvaluator(make_config()).evaluate_batch(pages, workers=2)
+    
+    serial = StructuredEvaluator(make_config())
+    assert batch_ratings == [serial.evaluate(html) for html in pages]
+    assert batch_ratings[:len(SAMPLE_PAGES)] == [
+        BASELINE_RESULTS[name][0] for name in sorted(SAMPLE_PAGES)
+    ]
+
+
+def test_evaluate_batch_workers_use_structure_checks(make_config):
+    config = make_config({'structured': {'check_headings': False}})
+    pages = _batch_pages(StructuredEvaluator.BATCH_PARALLEL_MIN_PAGES)
+    
+    batch_ratings = StructuredEvaluator(config).evaluate_batch(pages, workers=2)
+    
+    serial = StructuredEvaluator(config)
+    assert batch_ratings == [serial.evaluate(html) for html in pages]